@@ -28,6 +28,30 @@ class AloneChatAPIClient:
         self.base_url = f"http://{host}:{port}"
         self.token: Optional[str] = None
         self.username: Optional[str] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        The session keeps connections alive so consecutive requests skip the
+        TCP handshake. It must be created from within the running event loop.
+
+        Returns:
+            aiohttp.ClientSession: Shared session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=8, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session and its pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def _make_request(
         self, 
@@ -60,18 +84,17 @@ class AloneChatAPIClient:
             if headers:
                 default_headers.update(headers)
             
-            # Create a new session for each request
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=method, 
-                    url=url, 
-                    json=data, 
-                    headers=default_headers
-                ) as response:
-                    try:
-                        return await response.json()
-                    except Exception:
-                        return {"success": False, "message": f"Request failed with status {response.status}"}
+            session = self._get_session()
+            async with session.request(
+                method=method, 
+                url=url, 
+                json=data, 
+                headers=default_headers
+            ) as response:
+                try:
+                    return await response.json()
+                except Exception:
+                    return {"success": False, "message": f"Request failed with status {response.status}"}
         except Exception as e:
             return {"success": False, "message": f"Request failed: {str(e)}"}
 
@@ -200,13 +223,12 @@ class AloneChatAPIClient:
             if self.token:
                 headers["Authorization"] = f"Bearer {self.token}"
             
-            # Create a new session for each request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {"success": False, "error": f"Error: {response.status}"}
+            session = self._get_session()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    return await response.json()
+                else:
+                    return {"success": False, "error": f"Error: {response.status}"}
         except Exception as e:
             return {"success": False, "error": f"Error: {str(e)}"}
 
@@ -1,17 +1,16 @@
 """
 Client module for AloneChat application.
 Provides base client functionality and standard command-line client implementation.
+
+The client implementations and their UI submodules are imported on first
+access, so importing this package (e.g. for ``utils``) does not load curses,
+tkinter or the API client.
 """
 
-from . import auth
-from . import cli
-from . import input
-# Import submodules for easy access
-from . import ui
+import importlib
+
 from . import utils
 from .client_base import Client
-from .curses_client import CursesClient
-from .gui_client import SimpleGUIClient
 from .runner import run_client
 
 __all__ = [
@@ -25,3 +24,24 @@ __all__ = [
     'utils',
     'cli',
 ]
+
+# Public name -> (submodule, attribute); attribute None means the submodule itself
+_LAZY_ATTRS = {
+    'CursesClient': ('.curses_client', 'CursesClient'),
+    'SimpleGUIClient': ('.gui_client', 'SimpleGUIClient'),
+    'ui': ('.ui', None),
+    'input': ('.input', None),
+    'auth': ('.auth', None),
+    'cli': ('.cli', None),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
@@ -139,21 +139,27 @@ class CursesClient(Client):
         Background task to receive messages from the server.
         Runs continuously until client stops.
         """
+        # Consecutive failed receives; the long-poll itself is the wait, so
+        # only failures back off before the next request
+        failures = 0
         while self._running:
             try:
                 msg_data = await self._api_client.receive_message()
 
                 if not isinstance(msg_data, dict):
-                    await asyncio.sleep(0.1)
+                    failures = await self._receive_backoff(failures)
                     continue
 
                 if not msg_data.get("success"):
                     error = msg_data.get("error")
-                    if error and error != "Timeout waiting for message":
+                    if error == "Timeout waiting for message":
+                        continue
+                    if error:
                         self._message_buffer.add_error_message(f"Receive error: {error}")
-                    await asyncio.sleep(0.1)
+                    failures = await self._receive_backoff(failures)
                     continue
 
+                failures = 0
                 sender = msg_data.get("sender")
                 content = msg_data.get("content")
 
@@ -163,7 +169,21 @@ class CursesClient(Client):
             except asyncio.CancelledError:
                 break
             except Exception:
-                await asyncio.sleep(0.1)
+                failures = await self._receive_backoff(failures)
+
+    @staticmethod
+    async def _receive_backoff(failures: int) -> int:
+        """
+        Sleep before retrying a failed receive, doubling from 0.1s up to 5s.
+
+        Args:
+            failures: Number of consecutive failures so far
+
+        Returns:
+            int: Updated failure count
+        """
+        await asyncio.sleep(min(5.0, 0.1 * (1 << failures)))
+        return min(failures + 1, 6)
 
     async def _handle_input(self) -> None:
         """
@@ -184,6 +204,9 @@ class CursesClient(Client):
                     self._running = False
                     break
 
+                elif result == InputResult.RESIZE:
+                    self._renderer.on_resize()
+
                 # Small delay to prevent CPU spinning
                 await asyncio.sleep(1.0 / REFRESH_RATE_HZ)
 
@@ -246,18 +269,21 @@ class CursesClient(Client):
         # Initialize all components
         self._init_components(stdscr)
 
-        # Authenticate user
-        if not await self._authenticate():
-            return
-
-        # Main connection loop with reconnection support
-        while self._running:
-            try:
-                await self._run_chat_session()
-
-            except Exception as e:
-                self._message_buffer.add_error_message(f"Connection error: {e}")
-                await asyncio.sleep(3)
+        try:
+            # Authenticate user
+            if not await self._authenticate():
+                return
+
+            # Main connection loop with reconnection support
+            while self._running:
+                try:
+                    await self._run_chat_session()
+
+                except Exception as e:
+                    self._message_buffer.add_error_message(f"Connection error: {e}")
+                    await asyncio.sleep(3)
+        finally:
+            await self._api_client.close()
 
     async def _logout(self) -> None:
         """Perform graceful logout."""
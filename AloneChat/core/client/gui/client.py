@@ -16,11 +16,14 @@ Features:
 import asyncio
 import gc
 import os
+import queue
 import subprocess
 import sys
+import threading
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox, simpledialog
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 
 # noinspection PyUnusedImports
 import darkdetect
@@ -29,7 +32,6 @@ import sv_ttk
 from AloneChat.api.client import AloneChatAPIClient
 from AloneChat.core.client.client_base import Client
 from AloneChat.core.client.utils import DEFAULT_HOST, DEFAULT_API_PORT
-from .components import WinUI3MessageCard
 from .controllers.auth_view import AuthView
 from .controllers.chat_view import ChatView
 from .controllers.search_dialog import SearchDialog
@@ -51,6 +53,13 @@ class GUIClient(Client):
     - Responsive layout
     """
     
+    # Window for coalescing incoming messages into one UI update (ms)
+    MESSAGE_FLUSH_MS = 40
+    # Chat log lines are buffered and written at most this often (ms)...
+    LOG_FLUSH_MS = 500
+    # ...or as soon as this many lines are waiting
+    LOG_FLUSH_MAX = 100
+    
     def __init__(self, api_host: str = DEFAULT_HOST, api_port: int = DEFAULT_API_PORT):
         super().__init__(api_host, api_port)
         
@@ -82,8 +91,29 @@ class GUIClient(Client):
         # Reply context
         self._reply_ctx: Optional[ReplyContext] = None
         
+        # Incoming messages waiting for the next batched UI flush
+        self._pending_items: List[Tuple[str, MessageItem]] = []
+        self._flush_after_id: Optional[str] = None
+        
+        # (sender, content) chat log lines waiting to be written
+        self._chat_log_buffer: List[Tuple[str, str]] = []
+        self._log_after_id: Optional[str] = None
+        
+        # UI updates skipped while the window was minimized, applied on <Map>
+        self._deferred_render = False
+        self._deferred_list_refresh = False
+        
         # Poll future for cancellation
         self._poll_future = None
+        
+        # Latest login/register request; older ones are cancelled or ignored
+        self._auth_req_seq: int = 0
+        self._auth_future = None
+        
+        # Callbacks handed from the async thread to the Tk thread
+        self._ui_queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._ui_lock = threading.Lock()
+        self._ui_drain_scheduled = False
     
     # ==================== Lifecycle ====================
     
@@ -113,13 +143,70 @@ class GUIClient(Client):
         # Handle close
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
+        # Catch up on updates skipped while minimized
+        self.root.bind("<Map>", self._flush_deferred_ui, add="+")
+        
         # Start
         self.root.mainloop()
     
+    def _window_hidden(self) -> bool:
+        """Check if the main window is minimized or withdrawn."""
+        try:
+            return self.root.state() in ("iconic", "withdrawn")
+        except tk.TclError:
+            return False
+    
+    def _flush_deferred_ui(self, event=None):
+        """Apply chat view updates that were skipped while the window was hidden."""
+        # <Map> on the root is also delivered for every child widget
+        if event is not None and event.widget is not self.root:
+            return
+        if self._chat_view:
+            if self._deferred_list_refresh:
+                self._chat_view.refresh_conversation_list()
+            if self._deferred_render:
+                self._chat_view.render_conversation()
+                self._search_service.set_message_cards(self._chat_view.get_message_cards())
+        self._deferred_render = False
+        self._deferred_list_refresh = False
+    
     def _ui_alive(self) -> bool:
         """Check if UI is still alive."""
         return bool(self.root) and bool(self.root.winfo_exists()) and not self._closing
     
+    def _call_ui(self, fn: Callable[[], None]) -> None:
+        """Run ``fn`` on the Tk thread.
+        
+        Safe to call from the async thread. Callbacks queued in a burst are
+        drained by a single Tk event instead of one ``after`` call each.
+        """
+        if self.root is None or self._closing:
+            return
+        self._ui_queue.put(fn)
+        with self._ui_lock:
+            if self._ui_drain_scheduled:
+                return
+            self._ui_drain_scheduled = True
+        try:
+            self.root.after(0, self._drain_ui_queue)
+        except (RuntimeError, tk.TclError):
+            # Tk is shutting down
+            pass
+    
+    def _drain_ui_queue(self) -> None:
+        """Run all pending UI callbacks (Tk thread)."""
+        with self._ui_lock:
+            self._ui_drain_scheduled = False
+        while not self._closing:
+            try:
+                fn = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn()
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+    
     def _clear_view(self):
         """Clear current view."""
         if self._auth_view:
@@ -152,7 +239,6 @@ class GUIClient(Client):
     def _show_chat_view(self):
         """Show chat view."""
         self._clear_view()
-        self._running = True
         
         self._chat_view = ChatView(
             self.root,
@@ -173,14 +259,12 @@ class GUIClient(Client):
         # Bind search shortcut
         self.root.bind('<Control-f>', lambda e: self._open_search())
         
-        # Start polling
-        self._poll_future = self._async_service.run_async(self._poll_messages())
+        # Render conversation once; onboarding tips are appended incrementally
+        self._chat_view.render_conversation()
+        self._search_service.set_message_cards(self._chat_view.get_message_cards())
         
         # Show onboarding if first time
         self._show_onboarding()
-        
-        # Render conversation
-        self._chat_view.render_conversation()
     
     def _show_onboarding(self):
         """Show one-time onboarding tips."""
@@ -194,7 +278,7 @@ class GUIClient(Client):
                 "• Need help? Contact to us with tonytao2022 @outlook.com | zhang.chenyun @outlook.com"
             )
             state["onboarding_shown"] = True
-            self._persistence.save_state(state)
+            self._async_service.run_blocking(self._persistence.save_state, state)
     
     # ==================== Auth Handlers ====================
     
@@ -204,12 +288,22 @@ class GUIClient(Client):
             messagebox.showwarning("Login", "Please enter username and password")
             return
         
-        self._async_service.run_async(self._do_login(username, password))
+        seq = self._next_auth_seq()
+        self._auth_future = self._async_service.run_async(self._do_login(username, password, seq))
     
-    async def _do_login(self, username: str, password: str):
+    def _next_auth_seq(self) -> int:
+        """Supersede any in-flight login/register request and return the new sequence number."""
+        if self._auth_future and not self._auth_future.done():
+            self._auth_future.cancel()
+        self._auth_req_seq += 1
+        return self._auth_req_seq
+    
+    async def _do_login(self, username: str, password: str, seq: int):
         """Perform login."""
         try:
             response = await self._api_client.login(username, password)
+            if seq != self._auth_req_seq:
+                return
             
             if response.get("success"):
                 self._username = username
@@ -217,15 +311,17 @@ class GUIClient(Client):
                 self._api_client.username = username
                 self._api_client.token = self._token
                 
-                if self._ui_alive():
-                    self.root.after(0, self._show_chat_view)
+                # Start the first long-poll now so it overlaps with building the
+                # chat view; the view is queued first, so its results land after it
+                self._cancel_poll()
+                self._running = True
+                self._poll_future = self._async_service.run_async(self._poll_messages())
+                self._call_ui(self._show_chat_view)
             else:
                 error = response.get("message", "Login failed")
-                if self._ui_alive():
-                    self.root.after(0, lambda: messagebox.showerror("Login Failed", error))
+                self._call_ui(partial(messagebox.showerror, "Login Failed", error))
         except Exception as e:
-            if self._ui_alive():
-                self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
+            self._call_ui(partial(messagebox.showerror, "Error", str(e)))
     
     def _handle_register_request(self, username: str, password: str):
         """Handle register request from auth view."""
@@ -233,31 +329,32 @@ class GUIClient(Client):
             messagebox.showwarning("Register", "Please enter username and password")
             return
         
-        self._async_service.run_async(self._do_register(username, password))
+        seq = self._next_auth_seq()
+        self._auth_future = self._async_service.run_async(self._do_register(username, password, seq))
     
-    async def _do_register(self, username: str, password: str):
+    async def _do_register(self, username: str, password: str, seq: int):
         """Perform registration."""
         try:
             response = await self._api_client.register(username, password)
+            if seq != self._auth_req_seq:
+                return
             
             if response.get("success"):
-                if self._ui_alive():
-                    self.root.after(0, lambda: messagebox.showinfo(
-                        "Success", "Account created! Please sign in."
-                    ))
+                self._call_ui(partial(
+                    messagebox.showinfo, "Success", "Account created! Please sign in."
+                ))
             else:
                 error = response.get("message", "Registration failed")
-                if self._ui_alive():
-                    self.root.after(0, lambda: messagebox.showerror("Registration Failed", error))
+                self._call_ui(partial(messagebox.showerror, "Registration Failed", error))
         except Exception as e:
-            if self._ui_alive():
-                self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
+            self._call_ui(partial(messagebox.showerror, "Error", str(e)))
     
     def _handle_server_settings_changed(self, api_host: str, api_port: int):
         """Handle server settings change from auth view."""
         self._api_host = api_host
         self._api_port = api_port
-        # Recreate API client with new settings
+        # Recreate API client with new settings, releasing the old connection pool
+        self._async_service.run_async(self._api_client.close())
         self._api_client = AloneChatAPIClient(api_host, api_port)
         print(f"Server settings updated: API at {api_host}:{api_port}")
     
@@ -277,16 +374,19 @@ class GUIClient(Client):
         target_cid = self._conv_manager.active_cid
         payload, cid = self._conv_manager.prepare_send_payload(content, target_cid)
         
+        # Keep earlier incoming messages above the one being sent
+        self._flush_pending_messages()
+        self._flush_deferred_ui()
+        
         # Create local message
         item = MessageItem.create(self._username, content, is_self=True, status="Sending…")
         self._conv_manager.add_message(cid, item, is_active=(cid == target_cid))
         
         # Update UI if active conversation
         if cid == target_cid:
-            card = self._chat_view.add_message_card(item)
+            self._chat_view.add_message_card(item)
             self._search_service.set_message_cards(self._chat_view.get_message_cards())
         else:
-            card = None
             self._chat_view.refresh_conversation_list()
         
         # Clear input and reply
@@ -294,41 +394,42 @@ class GUIClient(Client):
         self._handle_clear_reply()
         
         # Send via API
-        self._async_service.run_async(self._send_message(payload, item, card))
+        self._async_service.run_async(self._send_message(payload, item))
     
-    async def _send_message(self, payload: str, item: MessageItem, 
-                           card: Optional[WinUI3MessageCard]):
+    async def _send_message(self, payload: str, item: MessageItem):
         """Send message via API."""
         try:
             response = await self._api_client.send_message(payload)
             
             if response.get("success"):
                 item.status = "✓"
-                if card and self._ui_alive():
-                    self.root.after(0, lambda: card.update_status("✓"))
+                self._call_ui(partial(self._update_item_status, item, "✓"))
             else:
                 error = response.get("message", "Failed to send")
                 item.status = f"Failed: {error}"
-                if card and self._ui_alive():
-                    self.root.after(0, lambda: card.update_status(
-                        "Failed — click to retry", 
-                        is_error=True,
-                        on_retry=lambda: self._retry_send(payload, item, card)
-                    ))
+                self._call_ui(partial(
+                    self._update_item_status, item, "Failed — click to retry",
+                    is_error=True, on_retry=partial(self._retry_send, payload, item)
+                ))
         except Exception as e:
             item.status = f"Error: {e}"
-            if card and self._ui_alive():
-                self.root.after(0, lambda: card.update_status(
-                    "Failed — click to retry",
-                    is_error=True,
-                    on_retry=lambda: self._retry_send(payload, item, card)
-                ))
-    
-    def _retry_send(self, payload: str, item: MessageItem, card: WinUI3MessageCard):
+            self._call_ui(partial(
+                self._update_item_status, item, "Failed — click to retry",
+                is_error=True, on_retry=partial(self._retry_send, payload, item)
+            ))
+    
+    def _update_item_status(self, item: MessageItem, text: str, is_error: bool = False,
+                            on_retry: Optional[Callable[[], None]] = None):
+        """Update the status of a single rendered message, if it is on screen."""
+        card = self._chat_view.card_for(item) if self._chat_view else None
+        if card:
+            card.update_status(text, is_error=is_error, on_retry=on_retry)
+    
+    def _retry_send(self, payload: str, item: MessageItem):
         """Retry a failed send."""
         item.status = "Sending…"
-        card.update_status("Sending…", is_error=False)
-        self._async_service.run_async(self._send_message(payload, item, card))
+        self._update_item_status(item, "Sending…", is_error=False)
+        self._async_service.run_async(self._send_message(payload, item))
     
     def _handle_new_conversation(self):
         """Handle new conversation request."""
@@ -340,12 +441,12 @@ class GUIClient(Client):
             return
         
         self._conv_manager.create_conversation(to_user, name=to_user)
-        self._conv_manager.switch_conversation(to_user)
-        self._chat_view.refresh_conversation_list()
-        self._chat_view.render_conversation()
+        self._handle_switch_conversation(to_user)
     
     def _handle_switch_conversation(self, cid: str):
-        """Handle conversation switch."""
+        """Handle conversation switch; re-selecting the open one does nothing."""
+        if cid == self._conv_manager.active_cid:
+            return
         self._conv_manager.switch_conversation(cid)
         self._chat_view.refresh_conversation_list()
         self._chat_view.render_conversation()
@@ -366,24 +467,33 @@ class GUIClient(Client):
         conv = self._conv_manager.get_active_conversation()
         if not conv:
             return
-        path = self._persistence.export_conversation_md(
-            self._username, conv.cid, conv.name,
-            [item.__dict__ for item in conv.items]
+        self._run_export(
+            self._persistence.export_conversation_md, self._username, conv.cid, conv.name,
+            [dict(item.__dict__) for item in conv.items]
         )
-        if path:
-            self._open_logs_folder()
     
     def _handle_export_json(self):
         """Export current conversation to JSON."""
         conv = self._conv_manager.get_active_conversation()
         if not conv:
             return
-        path = self._persistence.export_conversation_json(
-            self._username, conv.cid,
-            [item.__dict__ for item in conv.items]
+        self._run_export(
+            self._persistence.export_conversation_json, self._username, conv.cid,
+            [dict(item.__dict__) for item in conv.items]
         )
-        if path:
-            self._open_logs_folder()
+    
+    def _run_export(self, export: Callable, *args):
+        """Format and write an export on the I/O worker, then open the logs folder.
+        
+        Items are passed as copies so status updates cannot race the writer.
+        """
+        future = self._async_service.run_blocking(export, *args)
+        future.add_done_callback(self._on_export_done)
+    
+    def _on_export_done(self, future):
+        """Open the logs folder once an export was written (any thread)."""
+        if not future.cancelled() and future.exception() is None and future.result():
+            self._call_ui(self._open_logs_folder)
     
     def _handle_export_logs(self):
         """Open logs folder."""
@@ -405,6 +515,10 @@ class GUIClient(Client):
     def _handle_logout(self):
         """Handle logout request."""
         self._running = False
+        self._cancel_poll()
+        # Log lines belong to the user that is logging out
+        self._flush_pending_messages()
+        self._flush_chat_log()
         self._async_service.run_async(self._do_logout())
     
     async def _do_logout(self):
@@ -414,65 +528,138 @@ class GUIClient(Client):
         except:
             pass
         finally:
-            if self._ui_alive():
-                self.root.after(0, self._show_auth_view)
+            self._call_ui(self._show_auth_view)
     
     # ==================== Message Handling ====================
     
+    def _cancel_poll(self):
+        """Stop the running long-poll loop, if any."""
+        if self._poll_future and not self._poll_future.done():
+            self._poll_future.cancel()
+        self._poll_future = None
+    
     async def _poll_messages(self):
         """Poll for new messages."""
+        conv_manager = self._conv_manager
+        # Consecutive failed/empty receives; /recv already blocks until a
+        # message arrives, so only those back off before the next request
+        misses = 0
         while self._running and not self._closing:
             try:
+                # Client and user are read per pass, never bound across the
+                # wait, so a late reply is handled for whoever is logged in now
                 msg = await self._api_client.receive_message()
                 
-                if isinstance(msg, dict) and msg.get("success"):
-                    sender = msg.get("sender")
-                    content = msg.get("content")
+                if not (isinstance(msg, dict) and msg.get("success")):
+                    await asyncio.sleep(min(0.5, 0.01 * (1 << misses)))
+                    misses = min(misses + 1, 6)
+                    continue
+                misses = 0
+                
+                sender = msg.get("sender")
+                content = msg.get("content")
+                username = self._username
+                
+                if sender and content and sender != username:
+                    cid, actual_sender, body = conv_manager.process_received_message(
+                        sender, content, username
+                    )
                     
-                    if sender and content and sender != self._username:
-                        cid, actual_sender, body = self._conv_manager.process_received_message(
-                            sender, content, self._username
-                        )
+                    if cid:
+                        item = MessageItem.create(actual_sender, body, is_self=False)
+                        is_active = (cid == conv_manager.active_cid)
+                        conv_manager.add_message(cid, item, is_active=is_active)
                         
-                        if cid:
-                            item = MessageItem.create(actual_sender, body, is_self=False)
-                            is_active = (cid == self._conv_manager.active_cid)
-                            self._conv_manager.add_message(cid, item, is_active=is_active)
-                            
-                            if self._ui_alive():
-                                if is_active:
-                                    self.root.after(0, lambda: self._add_message_to_ui(item))
-                                else:
-                                    self.root.after(0, self._chat_view.refresh_conversation_list)
-                
-                await asyncio.sleep(0.1)
+                        if is_active:
+                            self._call_ui(partial(self._add_message_to_ui, cid, item))
+                        else:
+                            self._call_ui(self._refresh_conversation_list)
             except asyncio.CancelledError:
                 break
             except Exception:
                 await asyncio.sleep(0.5)
     
-    def _add_message_to_ui(self, item: MessageItem):
-        """Add a message to the UI."""
+    def _refresh_conversation_list(self):
+        """Refresh the conversation list if the chat view is shown."""
+        if self._chat_view:
+            if self._window_hidden():
+                self._deferred_list_refresh = True
+                return
+            self._chat_view.refresh_conversation_list()
+    
+    def _add_message_to_ui(self, cid: str, item: MessageItem):
+        """Queue a received message for the next batched UI flush."""
         if not self._chat_view:
             return
-        card = self._chat_view.add_message_card(item)
-        self._search_service.set_message_cards(self._chat_view.get_message_cards())
-        self._persistence.log_chat(self._username, item.sender, item.content)
+        self._pending_items.append((cid, item))
+        if self._flush_after_id is None:
+            self._flush_after_id = self.root.after(self.MESSAGE_FLUSH_MS, self._flush_pending_messages)
+    
+    def _flush_pending_messages(self):
+        """Render and log all queued messages in one pass."""
+        if self._flush_after_id is not None:
+            try:
+                self.root.after_cancel(self._flush_after_id)
+            except Exception:
+                pass
+            self._flush_after_id = None
+        pending, self._pending_items = self._pending_items, []
+        if not pending:
+            return
+        
+        # Messages for a conversation that is no longer shown are already in its
+        # model and will be rendered when it is selected again
+        active_cid = self._conv_manager.active_cid
+        active_items = [item for cid, item in pending if cid == active_cid]
+        if self._chat_view and active_items:
+            # While minimized they stay in the model until the window is shown
+            if self._window_hidden():
+                self._deferred_render = True
+            elif self._chat_view.add_message_cards(active_items):
+                self._search_service.set_message_cards(self._chat_view.get_message_cards())
+        self._queue_chat_log([(item.sender, item.content) for _, item in pending])
     
     def _add_system_message(self, content: str):
         """Add a system message."""
+        self._flush_pending_messages()
+        # Cards must stay in model order
+        self._flush_deferred_ui()
         item = MessageItem.create("System", content, is_system=True)
         self._conv_manager.add_message(self._conv_manager.active_cid, item, is_active=True)
         if self._chat_view:
             self._chat_view.add_message_card(item)
-        self._persistence.log_chat(self._username, "System", content)
+            # Adding may have trimmed the oldest cards, shifting hit indices
+            self._search_service.set_message_cards(self._chat_view.get_message_cards())
+        self._queue_chat_log([("System", content)])
+    
+    def _queue_chat_log(self, rows: List[Tuple[str, str]]):
+        """Buffer chat log lines and schedule a batched write."""
+        self._chat_log_buffer.extend(rows)
+        if len(self._chat_log_buffer) >= self.LOG_FLUSH_MAX:
+            self._flush_chat_log()
+        elif self._log_after_id is None and self.root:
+            self._log_after_id = self.root.after(self.LOG_FLUSH_MS, self._flush_chat_log)
+    
+    def _flush_chat_log(self):
+        """Write all buffered chat log lines off the UI thread."""
+        if self._log_after_id is not None:
+            try:
+                self.root.after_cancel(self._log_after_id)
+            except Exception:
+                pass
+            self._log_after_id = None
+        rows, self._chat_log_buffer = self._chat_log_buffer, []
+        if rows:
+            self._async_service.run_blocking(
+                self._persistence.log_chat_many, self._username, rows
+            )
     
     # ==================== Search ====================
     
     def _open_search(self):
-        """Open search dialog."""
-        if self._search_dialog and self._search_dialog.window and self._search_dialog.window.winfo_exists():
-            self._search_dialog.window.lift()
+        """Open search dialog, building it on first use."""
+        if self._search_dialog:
+            self._search_dialog.show()
             return
         
         self._search_dialog = SearchDialog(
@@ -504,20 +691,29 @@ class GUIClient(Client):
             self._chat_view.scroll_to_card(card)
     
     def _handle_search_close(self):
-        """Close search dialog."""
+        """Close search dialog (it is kept for reuse)."""
         self._search_service.clear()
-        self._search_dialog = None
     
     # ==================== Cleanup ====================
     
     def _on_close(self):
         """Handle window close."""
+        # Write out anything still queued before the async service stops
+        self._flush_pending_messages()
+        self._flush_chat_log()
+        
         self._closing = True
         self._running = False
         
-        # Cancel poll future
-        if self._poll_future and not self._poll_future.done():
-            self._poll_future.cancel()
+        self._cancel_poll()
+        
+        # Close pooled HTTP connections while the loop is still running
+        close_future = self._async_service.run_async(self._api_client.close())
+        if close_future:
+            try:
+                close_future.result(timeout=1.0)
+            except Exception:
+                pass
         
         # Stop async service
         self._async_service.stop()
@@ -3,6 +3,7 @@ Components using sv_ttk (Sun Valley theme) - standard ttk widgets.
 """
 import tkinter as tk
 from tkinter import ttk
+from typing import Optional
 
 
 class WinUI3Entry(ttk.Frame):
@@ -71,15 +72,10 @@ class WinUI3ScrollableFrame(ttk.Frame):
     
     def _setup_scrolling(self):
         """Setup scroll behavior."""
-        def on_content_configure(event):
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-            canvas_width = self.canvas.winfo_width()
-            self.canvas.itemconfig(self.content_window, width=canvas_width)
-        
         def on_canvas_configure(event):
             self.canvas.itemconfig(self.content_window, width=event.width)
         
-        self.content.bind('<Configure>', on_content_configure)
+        self.content.bind('<Configure>', self._on_content_configure)
         self.canvas.bind('<Configure>', on_canvas_configure)
         
         def on_mousewheel(event):
@@ -91,6 +87,34 @@ class WinUI3ScrollableFrame(ttk.Frame):
         
         self.canvas.bind_all("<MouseWheel>", on_mousewheel)
     
+    def _on_content_configure(self, event=None):
+        """Keep the scroll region and content width in sync with the canvas."""
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        canvas_width = self.canvas.winfo_width()
+        self.canvas.itemconfig(self.content_window, width=canvas_width)
+    
+    def new_content(self) -> ttk.Frame:
+        """Create an empty, not yet displayed content frame for batch building."""
+        return ttk.Frame(self.canvas)
+    
+    def swap_content(self, content: ttk.Frame, keep_old: bool = False) -> Optional[ttk.Frame]:
+        """Display a frame from new_content() in place of the current one.
+        
+        The previous frame is destroyed, removing all of its children in one
+        call, unless keep_old is set; then it is only hidden and returned so
+        it can be swapped back in later.
+        """
+        old = self.content
+        self.content = content
+        self.content.bind('<Configure>', self._on_content_configure)
+        self.canvas.itemconfig(self.content_window, window=self.content)
+        # A previously shown frame keeps its size and sends no <Configure>
+        self._on_content_configure()
+        if keep_old:
+            return old
+        old.destroy()
+        return None
+    
     def scroll_to_bottom(self):
         """Scroll to bottom."""
         self.canvas.update_idletasks()
@@ -10,6 +10,11 @@ from typing import Optional, Callable
 class WinUI3MessageCard(ttk.Frame):
     """Message card using pure ttk widgets for sv_ttk styling."""
     
+    # Static widget options shared by every card
+    _BUBBLE_OPTS = {"text": "", "padding": 8}
+    _CONTENT_OPTS = {"wraplength": 500, "justify": "left"}
+    _REPLY_OPTS = {"text": "Reply", "width": 6}
+    
     def __init__(self, parent, sender: str, content: str,
                  is_self: bool = False, is_system: bool = False,
                  timestamp: Optional[str] = None,
@@ -66,28 +71,20 @@ class WinUI3MessageCard(ttk.Frame):
         outer = ttk.Frame(self)
         outer.pack(fill="x")
         
-        # Spacer to push content right
-        ttk.Frame(outer).pack(side="left", expand=True, fill="x")
-        
-        # Message bubble container
-        bubble_container = ttk.Frame(outer)
-        bubble_container.pack(side="right", padx=8)
-        
-        # Message bubble using Labelframe for border effect
-        bubble = ttk.Labelframe(bubble_container, text="", padding=8)
-        bubble.pack(fill="x")
+        # Message bubble using Labelframe for border effect; packing it
+        # to the right is enough to right-align it, no spacer needed
+        bubble = ttk.Labelframe(outer, **self._BUBBLE_OPTS)
+        bubble.pack(side="right", padx=8)
         
         # Reply button in top-right
         if self.on_reply is not None:
             header = ttk.Frame(bubble)
             header.pack(fill="x")
-            ttk.Frame(header).pack(side="left", expand=True)
-            reply_btn = ttk.Button(header, text="Reply", width=6,
-                                  command=lambda: self.on_reply(self.sender, self.content, self.timestamp))
-            reply_btn.pack(side="right")
+            ttk.Button(header, command=self._on_reply_click,
+                       **self._REPLY_OPTS).pack(side="right")
         
         # Message content - wraplength for high-DPI displays
-        content_lbl = ttk.Label(bubble, text=self.content, wraplength=500, justify="left")
+        content_lbl = ttk.Label(bubble, text=self.content, **self._CONTENT_OPTS)
         content_lbl.pack(anchor="e")
         self._content_label = content_lbl
         
@@ -106,30 +103,22 @@ class WinUI3MessageCard(ttk.Frame):
         outer = ttk.Frame(self)
         outer.pack(fill="x")
         
-        # Message bubble container
-        bubble_container = ttk.Frame(outer)
-        bubble_container.pack(side="left", padx=8)
-        
         # Message bubble
-        bubble = ttk.Labelframe(bubble_container, text="", padding=8)
-        bubble.pack(fill="x")
+        bubble = ttk.Labelframe(outer, **self._BUBBLE_OPTS)
+        bubble.pack(side="left", padx=8)
         
         # Reply button in top-right
         if self.on_reply is not None:
             header = ttk.Frame(bubble)
             header.pack(fill="x")
-            ttk.Frame(header).pack(side="left", expand=True)
-            reply_btn = ttk.Button(header, text="Reply", width=6,
-                                  command=lambda: self.on_reply(self.sender, self.content, self.timestamp))
-            reply_btn.pack(side="right")
+            ttk.Button(header, command=self._on_reply_click,
+                       **self._REPLY_OPTS).pack(side="right")
         
         # Sender name
-        sender_frame = ttk.Frame(bubble)
-        sender_frame.pack(fill="x")
-        ttk.Label(sender_frame, text=self.sender).pack(anchor="w")
+        ttk.Label(bubble, text=self.sender).pack(anchor="w")
         
         # Message content - wraplength for high-DPI displays
-        content_lbl = ttk.Label(bubble, text=self.content, wraplength=500, justify="left")
+        content_lbl = ttk.Label(bubble, text=self.content, **self._CONTENT_OPTS)
         content_lbl.pack(anchor="w", pady=(4, 0))
         self._content_label = content_lbl
         
@@ -137,9 +126,10 @@ class WinUI3MessageCard(ttk.Frame):
         footer = ttk.Frame(bubble)
         footer.pack(fill="x", pady=(4, 0))
         ttk.Label(footer, text=self.timestamp).pack(side="left")
-        
-        # Spacer
-        ttk.Frame(outer).pack(side="left", expand=True, fill="x")
+    
+    def _on_reply_click(self):
+        """Forward the reply button press with this message's details."""
+        self.on_reply(self.sender, self.content, self.timestamp)
     
     def update_status(self, text: str, is_error: bool = False,
                       on_retry: Optional[Callable[[], None]] = None):
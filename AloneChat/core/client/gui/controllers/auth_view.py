@@ -31,6 +31,7 @@ class AuthView:
         self.server_settings_frame: Optional[ttk.LabelFrame] = None
         self.settings_toggle_btn: Optional[ttk.Button] = None
         self.server_settings_visible = False
+        self._settings_parent: Optional[ttk.Frame] = None
         
     def show(self):
         """Display the auth view with sv_ttk styling - horizontal layout."""
@@ -119,9 +120,22 @@ class AuthView:
         )
         self.settings_toggle_btn.pack(side="right")
         
-        # Server Settings Frame (initially hidden)
-        self.server_settings_frame = ttk.LabelFrame(form_container, text="Server Configuration", padding=16)
-        # Don't pack yet - will be shown when toggled
+        # Server Settings Frame is built on first toggle - most sessions never open it
+        self._settings_parent = form_container
+        
+        # Bind Enter key
+        self.root.unbind('<Return>')
+        self.root.bind('<Return>', lambda e: self._handle_login())
+    
+    def hide(self):
+        """Hide the auth view."""
+        if self.frame:
+            self.frame.destroy()
+            self.frame = None
+    
+    def _build_server_settings(self):
+        """Build the (initially hidden) server settings frame."""
+        self.server_settings_frame = ttk.LabelFrame(self._settings_parent, text="Server Configuration", padding=16)
         
         # API Host
         host_frame = ttk.Frame(self.server_settings_frame)
@@ -145,16 +159,6 @@ class AuthView:
             text="Apply Settings",
             command=self._apply_server_settings
         ).pack(fill="x", pady=(16, 0))
-        
-        # Bind Enter key
-        self.root.unbind('<Return>')
-        self.root.bind('<Return>', lambda e: self._handle_login())
-    
-    def hide(self):
-        """Hide the auth view."""
-        if self.frame:
-            self.frame.destroy()
-            self.frame = None
     
     def _handle_login(self):
         """Handle login button click."""
@@ -177,6 +181,8 @@ class AuthView:
                 self.settings_toggle_btn.configure(text="⚙ Server Settings")
             self.server_settings_visible = False
         else:
+            if self.server_settings_frame is None and self._settings_parent:
+                self._build_server_settings()
             if self.server_settings_frame:
                 self.server_settings_frame.pack(fill="x", pady=(16, 0))
             if self.settings_toggle_btn:
@@ -3,17 +3,37 @@ Chat view with conversations, messages, and input - sv_ttk styled.
 Uses ttk.Combobox for conversation selection (TTK widget, not TK).
 """
 import tkinter as tk
+from collections import OrderedDict
+from dataclasses import dataclass
 from tkinter import ttk
-from typing import Callable, Optional, List
+from typing import Callable, Dict, Iterable, Optional, List, Tuple
 
 from ..components import WinUI3ScrollableFrame, WinUI3MessageCard
 from ..models.data import MessageItem, ReplyContext
 from ..services.conversation_manager import ConversationManager
 
 
+@dataclass
+class _RenderedConversation:
+    """Cards of a conversation kept off-screen for a fast switch back."""
+    content: ttk.Frame
+    cards: List[WinUI3MessageCard]
+    keys: List[int]
+    card_for_item: Dict[int, WinUI3MessageCard]
+    count: int
+
+
 class ChatView:
     """Main chat view with sidebar and message area - sv_ttk styled."""
     
+    # Most message cards kept on screen; older ones are dropped from the view
+    # (the full history stays in the conversation model)
+    MAX_RENDERED_CARDS = 500
+    # Quiet period before a conversation selection is applied (ms)
+    SELECT_DEBOUNCE_MS = 120
+    # Recently viewed conversations whose cards are kept for switching back
+    CACHED_RENDERS = 4
+    
     def __init__(self, root: tk.Tk, username: str,
                  conversation_manager: ConversationManager,
                  on_send: Callable[[str], None],
@@ -50,6 +70,27 @@ class ChatView:
         
         # Message cards for current view
         self.message_cards: List[WinUI3MessageCard] = []
+        # Rendered card per message item, keyed by id(item)
+        self._card_for_item: Dict[int, WinUI3MessageCard] = {}
+        # id(item) for each entry of message_cards, in the same order
+        self._card_keys: List[int] = []
+        # Number of leading conversation items covered by the current render
+        self._rendered_count: int = 0
+        # Conversation the current cards belong to
+        self._rendered_cid: Optional[str] = None
+        # Hidden renders of other conversations, least recently shown first
+        self._render_cache: "OrderedDict[str, _RenderedConversation]" = OrderedDict()
+        
+        # Last values pushed to the combobox, used to skip no-op refreshes
+        self._applied_labels: Tuple[str, ...] = ()
+        self._applied_index: int = -1
+        
+        # Text of the reply banner while it is shown, None while hidden
+        self._reply_banner_text: Optional[str] = None
+        
+        # Selection waiting for the debounce timer
+        self._pending_select_cid: Optional[str] = None
+        self._select_after_id: Optional[str] = None
     
     def show(self):
         """Display the chat view with sv_ttk styling."""
@@ -69,6 +110,9 @@ class ChatView:
     
     def hide(self):
         """Hide the chat view."""
+        self._cancel_pending_select()
+        # Cached frames live inside the canvas and go away with it
+        self._render_cache.clear()
         if self.header:
             self.header.destroy()
             self.header = None
@@ -123,7 +167,7 @@ class ChatView:
         
         # New conversation button
         ttk.Button(sidebar, text="New Conversation", 
-                  command=self.on_new_conversation).pack(fill="x", pady=(0, 12))
+                  command=self._on_new_clicked).pack(fill="x", pady=(0, 12))
         
         # Conversation selector using Combobox (TTK widget)
         ttk.Label(sidebar, text="Select conversation:").pack(anchor="w", pady=(0, 4))
@@ -191,12 +235,55 @@ class ChatView:
         if selection < 0:
             return
         
-        conv_ids = self.conv_manager.conversation_ids
-        if 0 <= selection < len(conv_ids):
-            self.on_select_conversation(conv_ids[selection])
+        cid = self.conv_manager.conversation_id_at(selection)
+        if cid is not None:
+            # Scrolling through the list only renders the final selection
+            self._cancel_pending_select()
+            self._pending_select_cid = cid
+            self._select_after_id = self.root.after(self.SELECT_DEBOUNCE_MS,
+                                                    self._apply_pending_select)
+    
+    def _cancel_pending_select(self):
+        """Cancel a scheduled conversation switch, if any."""
+        if self._select_after_id:
+            try:
+                self.root.after_cancel(self._select_after_id)
+            except Exception:
+                pass
+        self._select_after_id = None
+        self._pending_select_cid = None
+    
+    def _apply_pending_select(self):
+        """Switch to the conversation selected last."""
+        cid = self._pending_select_cid
+        self._select_after_id = None
+        self._pending_select_cid = None
+        if cid is not None:
+            self.on_select_conversation(cid)
+    
+    def flush_pending_select(self):
+        """Apply a scheduled conversation switch immediately."""
+        if self._select_after_id:
+            try:
+                self.root.after_cancel(self._select_after_id)
+            except Exception:
+                pass
+            self._apply_pending_select()
+    
+    def _on_new_clicked(self):
+        """Handle new conversation button; it supersedes a pending selection."""
+        if self._pending_select_cid is not None:
+            self._cancel_pending_select()
+            # The combobox still shows the dropped selection; point it back
+            # at the conversation that is actually active
+            self._applied_index = -1
+            self.refresh_conversation_list()
+        self.on_new_conversation()
     
     def _on_send_clicked(self):
         """Handle send button click."""
+        # Send to the conversation the user has selected
+        self.flush_pending_select()
         content = self.msg_entry.get() if self.msg_entry else ""
         if content.strip():
             self.on_send(content)
@@ -214,28 +301,39 @@ class ChatView:
         # Get conversation labels
         labels = self.conv_manager.get_conversation_labels()
         
-        # Update combobox values
-        self.conv_combo['values'] = labels
+        # Update combobox values only when a label was added, removed or renamed
+        if labels is not self._applied_labels and labels != self._applied_labels:
+            self.conv_combo['values'] = labels
+            self._applied_labels = labels
+            self._applied_index = -1
         
         # Set current selection
-        try:
-            idx = self.conv_manager.conversation_ids.index(self.conv_manager.active_cid)
-            self.conv_combo.current(idx)
-        except (ValueError, tk.TclError):
-            pass
+        idx = self.conv_manager.index_of(self.conv_manager.active_cid)
+        if idx >= 0 and idx != self._applied_index:
+            try:
+                self.conv_combo.current(idx)
+                self._applied_index = idx
+            except tk.TclError:
+                pass
     
     def show_reply_banner(self, ctx: ReplyContext):
         """Show reply banner with context."""
         if self.reply_banner and self.reply_label:
             snippet = ctx.get_snippet(80)
-            self.reply_label.config(
-                text=f"Replying to {ctx.sender} ({ctx.timestamp}): {snippet}")
-            self.reply_banner.pack(fill="x", pady=(0, 8))
+            text = f"Replying to {ctx.sender} ({ctx.timestamp}): {snippet}"
+            if text == self._reply_banner_text:
+                return
+            self.reply_label.config(text=text)
+            if self._reply_banner_text is None:
+                self.reply_banner.pack(fill="x", pady=(0, 8))
+            self._reply_banner_text = text
     
     def hide_reply_banner(self):
         """Hide the reply banner."""
-        if self.reply_banner:
+        # Called after every send; only touch the widget if it is shown
+        if self.reply_banner and self._reply_banner_text is not None:
             self.reply_banner.pack_forget()
+            self._reply_banner_text = None
     
     def clear_message_entry(self):
         """Clear the message entry field."""
@@ -243,35 +341,65 @@ class ChatView:
             self.msg_entry.delete(0, tk.END)
     
     def render_conversation(self):
-        """Render the active conversation messages."""
+        """Render the active conversation messages.
+        
+        If the active conversation is already on screen, or was shown
+        recently, only messages added since its last render are appended.
+        """
         if not self.messages_container:
             return
         
-        # Clear existing messages
-        if hasattr(self.messages_container, 'content') and self.messages_container.content:
-            for w in list(self.messages_container.content.winfo_children()):
-                w.destroy()
-        self.message_cards = []
-        
-        # Get active conversation
         conv = self.conv_manager.get_active_conversation()
-        if not conv:
+        if conv and conv.cid == self._rendered_cid and self.message_cards:
+            self.add_message_cards(conv.items[self._rendered_count:])
             return
         
-        # Render messages
-        for item in conv.items:
-            card = self._create_message_card(item)
-            card.pack(fill="x", pady=4)
-            self.message_cards.append(card)
-        
-        if hasattr(self.messages_container, 'scroll_to_bottom'):
-            self.messages_container.scroll_to_bottom()
+        # Park the current render so switching back does not rebuild it
+        parked = None
+        if self._rendered_cid is not None and self.message_cards:
+            parked = _RenderedConversation(
+                self.messages_container.content, self.message_cards,
+                self._card_keys, self._card_for_item, self._rendered_count)
+        parked_cid = self._rendered_cid
+        
+        cached = self._render_cache.pop(conv.cid, None) if conv else None
+        if cached:
+            content = cached.content
+            self.message_cards = cached.cards
+            self._card_for_item = cached.card_for_item
+            self._card_keys = cached.keys
+            self._rendered_count = cached.count
+        else:
+            # Build all cards into a fresh, undisplayed frame, then swap it in once
+            content = self.messages_container.new_content()
+            self.message_cards = []
+            self._card_for_item = {}
+            self._card_keys = []
+            self._rendered_count = 0
+            if conv:
+                items = conv.items[-self.MAX_RENDERED_CARDS:]
+                self._rendered_count = len(conv.items) - len(items)
+                for item in items:
+                    self._append_card(item, parent=content)
+        self._rendered_cid = conv.cid if conv else None
+        
+        self.messages_container.swap_content(content, keep_old=parked is not None)
+        if parked is not None:
+            self._render_cache[parked_cid] = parked
+            while len(self._render_cache) > self.CACHED_RENDERS:
+                _, evicted = self._render_cache.popitem(last=False)
+                evicted.content.destroy()
+        
+        if cached:
+            self.add_message_cards(conv.items[self._rendered_count:])
+        self.messages_container.scroll_to_bottom()
     
-    def _create_message_card(self, item: MessageItem) -> WinUI3MessageCard:
+    def _create_message_card(self, item: MessageItem,
+                             parent: Optional[tk.Widget] = None) -> WinUI3MessageCard:
         """Create a message card from a message item."""
         on_reply = None if item.is_system else self.on_reply
         return WinUI3MessageCard(
-            self.messages_container.content,
+            parent or self.messages_container.content,
             sender=item.sender,
             content=item.content,
             is_self=item.is_self,
@@ -281,14 +409,55 @@ class ChatView:
             on_reply=on_reply,
         )
     
-    def add_message_card(self, item: MessageItem) -> WinUI3MessageCard:
-        """Add a single message card to the view."""
-        card = self._create_message_card(item)
+    def _append_card(self, item: MessageItem,
+                     parent: Optional[tk.Widget] = None) -> WinUI3MessageCard:
+        """Create, pack and register the card for a message item."""
+        card = self._create_message_card(item, parent)
         card.pack(fill="x", pady=4)
         self.message_cards.append(card)
+        self._card_keys.append(id(item))
+        self._card_for_item[id(item)] = card
+        self._rendered_count += 1
+        return card
+    
+    def _trim_cards(self):
+        """Destroy the oldest cards beyond MAX_RENDERED_CARDS."""
+        excess = len(self.message_cards) - self.MAX_RENDERED_CARDS
+        if excess <= 0:
+            return
+        for card in self.message_cards[:excess]:
+            card.destroy()
+        for key in self._card_keys[:excess]:
+            self._card_for_item.pop(key, None)
+        del self.message_cards[:excess]
+        del self._card_keys[:excess]
+    
+    def add_message_card(self, item: MessageItem) -> WinUI3MessageCard:
+        """Add a single message card to the view."""
+        card = self._append_card(item)
+        self._trim_cards()
         self.messages_container.scroll_to_bottom()
         return card
     
+    def add_message_cards(self, items: Iterable[MessageItem]) -> int:
+        """Append cards for several items, scrolling once at the end.
+        
+        Items that are already rendered are skipped. Returns the number of
+        cards added.
+        """
+        if not self.messages_container:
+            return 0
+        added = 0
+        for item in items:
+            if id(item) in self._card_for_item:
+                continue
+            self._append_card(item)
+            added += 1
+        if added:
+            self._trim_cards()
+            self.messages_container.scroll_to_bottom()
+        return added
+    
     def scroll_to_bottom(self):
         """Scroll to bottom of messages."""
         if self.messages_container:
@@ -299,6 +468,17 @@ class ChatView:
         if self.messages_container:
             self.messages_container.scroll_to_widget(card)
     
+    def card_for(self, item: MessageItem) -> Optional[WinUI3MessageCard]:
+        """Get the rendered card for a message item, if it is on screen or cached."""
+        key = id(item)
+        card = self._card_for_item.get(key)
+        if card is None:
+            for rendered in self._render_cache.values():
+                card = rendered.card_for_item.get(key)
+                if card is not None:
+                    break
+        return card
+    
     def get_message_cards(self) -> List[WinUI3MessageCard]:
         """Get all message cards in current view."""
         return self.message_cards
@@ -9,6 +9,9 @@ from typing import Callable
 class SearchDialog:
     """Floating search dialog for message search."""
     
+    # Delay after the last keystroke before searching
+    SEARCH_DEBOUNCE_MS = 120
+    
     def __init__(self, root: tk.Tk, on_search: Callable[[str], int],
                  on_next: Callable[[], None],
                  on_prev: Callable[[], None],
@@ -21,11 +24,19 @@ class SearchDialog:
         
         self.window = None
         self.search_var = None
+        self._entry = None
+        self._search_after_id = None
     
     def show(self):
-        """Show the search dialog."""
+        """Show the search dialog, reusing the window built on first use."""
         if self.window and self.window.winfo_exists():
+            self.window.deiconify()
             self.window.lift()
+            if self._entry:
+                self._entry.focus_set()
+                self._entry.select_range(0, tk.END)
+            # Messages may have changed while the dialog was hidden
+            self._on_search()
             return
         
         self.window = tk.Toplevel(self.root)
@@ -42,6 +53,7 @@ class SearchDialog:
         ent = ttk.Entry(frm, textvariable=self.search_var)
         ent.pack(fill="x", pady=8)
         ent.focus_set()
+        self._entry = ent
         
         btns = ttk.Frame(frm)
         btns.pack(fill="x")
@@ -49,35 +61,62 @@ class SearchDialog:
         ttk.Button(btns, text="Next", command=self.on_next).pack(side="left", padx=(8, 0))
         ttk.Button(btns, text="Close", command=self._on_close).pack(side="right")
         
-        ent.bind("<Return>", lambda e: self.on_next())
+        ent.bind("<Return>", lambda e: self._on_return())
         self.window.bind("<Escape>", lambda e: self._on_close())
-        self.search_var.trace_add("write", lambda *_: self._on_search())
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.search_var.trace_add("write", lambda *_: self._schedule_search())
         
         self._on_search()
     
+    def _schedule_search(self):
+        """Debounce search so a burst of keystrokes triggers a single scan."""
+        if not self.window:
+            return
+        self._cancel_pending_search()
+        self._search_after_id = self.window.after(self.SEARCH_DEBOUNCE_MS, self._on_search)
+    
+    def _cancel_pending_search(self):
+        """Cancel a scheduled search, if any."""
+        if self._search_after_id and self.window:
+            try:
+                self.window.after_cancel(self._search_after_id)
+            except Exception:
+                pass
+        self._search_after_id = None
+    
     def _on_search(self):
         """Handle search text change."""
+        self._search_after_id = None
         query = self.search_var.get() if self.search_var else ""
         self.on_search(query)
     
+    def _on_return(self):
+        """Run any pending search immediately, then jump to the next hit."""
+        if self._search_after_id:
+            self._cancel_pending_search()
+            self._on_search()
+        self.on_next()
+    
     def _on_close(self):
-        """Handle close button."""
+        """Handle close button - withdraw the window so it can be reshown cheaply."""
+        self._cancel_pending_search()
         self.on_close()
         if self.window:
             try:
-                self.window.destroy()
+                self.window.withdraw()
             except Exception:
-                pass
-        self.window = None
+                self.window = None
     
     def hide(self):
         """Hide the search dialog."""
+        self._cancel_pending_search()
         if self.window:
             try:
                 self.window.destroy()
             except Exception:
                 pass
         self.window = None
+        self._entry = None
     
     def get_query(self) -> str:
         """Get current search query."""
@@ -40,6 +40,15 @@ class Conversation:
     name: str
     items: List[MessageItem] = field(default_factory=list)
     unread: int = 0
+    # Display label cached here and refreshed only when unread changes
+    label: str = field(init=False, repr=False, compare=False, default="")
+    
+    def __post_init__(self) -> None:
+        self._update_label()
+    
+    def _update_label(self) -> None:
+        """Recompute the cached display label."""
+        self.label = f"{self.name} ({self.unread})" if self.unread > 0 else self.name
     
     def add_message(self, item: MessageItem) -> None:
         """Add a message to this conversation."""
@@ -47,11 +56,14 @@ class Conversation:
     
     def mark_read(self) -> None:
         """Mark all messages as read."""
-        self.unread = 0
+        if self.unread:
+            self.unread = 0
+            self._update_label()
     
     def increment_unread(self) -> None:
         """Increment unread count."""
         self.unread += 1
+        self._update_label()
 
 
 @dataclass
@@ -63,7 +75,8 @@ class ReplyContext:
     
     def get_snippet(self, max_length: int = 80) -> str:
         """Get a snippet of the content for display."""
-        snippet = self.content.replace("\n", " ")
+        # Only the first max_length + 1 characters can end up displayed
+        snippet = self.content[:max_length + 1].replace("\n", " ")
         if len(snippet) > max_length:
             snippet = snippet[:max_length] + "…"
         return snippet
@@ -4,7 +4,8 @@ Async service for handling API calls and event loop.
 import asyncio
 import threading
 import time
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
 
 
 class AsyncService:
@@ -13,6 +14,7 @@ class AsyncService:
     def __init__(self):
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
+        self._io_executor: Optional[ThreadPoolExecutor] = None
         self._running = False
     
     def start(self) -> None:
@@ -27,6 +29,8 @@ class AsyncService:
         
         self._thread = threading.Thread(target=run_loop, daemon=False)
         self._thread.start()
+        # Single worker keeps blocking I/O (e.g. log appends) in submission order
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gui-io")
         self._running = True
         
         # Wait for loop to be ready
@@ -60,9 +64,14 @@ class AsyncService:
         except Exception:
             pass
         
+        # Flush pending disk writes before going away
+        if self._io_executor:
+            self._io_executor.shutdown(wait=True)
+        
         self._running = False
         self._loop = None
         self._thread = None
+        self._io_executor = None
     
     async def _shutdown_loop(self) -> None:
         """Cancel all tasks and stop the loop."""
@@ -83,6 +92,21 @@ class AsyncService:
             return None
         return asyncio.run_coroutine_threadsafe(coro, self._loop)
     
+    def run_blocking(self, func: Callable, *args) -> Future:
+        """Run a blocking callable (disk I/O) off the UI thread.
+        
+        Falls back to a synchronous call when the service is not running; the
+        returned future is then already done.
+        """
+        if not self._io_executor or not self._running:
+            future: Future = Future()
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return self._io_executor.submit(func, *args)
+    
     def is_running(self) -> bool:
         """Check if the async service is running."""
         return self._running and self._loop is not None
@@ -16,6 +16,8 @@ class ConversationManager:
     def __init__(self):
         self._conversations: Dict[str, Conversation] = {}
         self._conv_ids: List[str] = []
+        self._conv_index: Dict[str, int] = {}
+        self._labels_cache: Optional[Tuple[str, ...]] = None
         self._active_cid: str = "global"
         self._ensure_conversation("global", name="# Global")
     
@@ -30,12 +32,23 @@ class ConversationManager:
         self._active_cid = cid
         if cid in self._conversations:
             self._conversations[cid].mark_read()
+            self._labels_cache = None
     
     @property
     def conversation_ids(self) -> List[str]:
         """Get list of conversation IDs."""
         return self._conv_ids.copy()
     
+    def index_of(self, cid: str) -> int:
+        """Get the display position of a conversation, or -1 if unknown."""
+        return self._conv_index.get(cid, -1)
+    
+    def conversation_id_at(self, index: int) -> Optional[str]:
+        """Get the conversation ID at a display position."""
+        if 0 <= index < len(self._conv_ids):
+            return self._conv_ids[index]
+        return None
+    
     def get_conversation(self, cid: str) -> Optional[Conversation]:
         """Get conversation by ID."""
         return self._conversations.get(cid)
@@ -48,8 +61,10 @@ class ConversationManager:
         """Ensure a conversation exists, creating it if necessary."""
         if cid not in self._conversations:
             self._conversations[cid] = Conversation(cid=cid, name=name or cid)
-        if cid not in self._conv_ids:
+        if cid not in self._conv_index:
+            self._conv_index[cid] = len(self._conv_ids)
             self._conv_ids.append(cid)
+            self._labels_cache = None
         return self._conversations[cid]
     
     def switch_conversation(self, cid: str) -> bool:
@@ -58,6 +73,7 @@ class ConversationManager:
             return False
         self._active_cid = cid
         self._conversations[cid].mark_read()
+        self._labels_cache = None
         return True
     
     def create_conversation(self, cid: str, name: Optional[str] = None) -> Conversation:
@@ -70,18 +86,35 @@ class ConversationManager:
         conv.add_message(item)
         if not is_active and not item.is_self:
             conv.increment_unread()
+            self._labels_cache = None
     
-    def get_conversation_labels(self) -> List[str]:
-        """Get display labels for all conversations."""
-        labels = []
-        for cid in self._conv_ids:
-            conv = self._conversations.get(cid)
-            if conv:
-                label = conv.name
-                if conv.unread > 0:
-                    label = f"{label} ({conv.unread})"
-                labels.append(label)
-        return labels
+    def reorder(self, ids: List[str]) -> bool:
+        """Set the display order of conversations.
+        
+        ``ids`` must contain exactly the known conversation IDs. Returns True
+        if the order changed.
+        """
+        if ids == self._conv_ids:
+            return False
+        if len(ids) != len(self._conv_ids) or set(ids) != self._conv_index.keys():
+            raise ValueError("reorder() expects a permutation of the conversation IDs")
+        self._conv_ids = list(ids)
+        self._conv_index = {cid: i for i, cid in enumerate(self._conv_ids)}
+        self._labels_cache = None
+        return True
+    
+    def get_conversation_labels(self) -> Tuple[str, ...]:
+        """Get display labels for all conversations.
+        
+        The result is cached until a conversation is added, reordered or its
+        unread count changes.
+        """
+        if self._labels_cache is None:
+            conversations = self._conversations
+            self._labels_cache = tuple(
+                conversations[cid].label for cid in self._conv_ids if cid in conversations
+            )
+        return self._labels_cache
     
     @staticmethod
     def pack_dm(to_user: str, body: str) -> str:
@@ -90,11 +123,14 @@ class ConversationManager:
     
     def unpack_dm(self, content: str) -> Tuple[bool, Optional[str], str]:
         """Unpack a DM message, returning (is_dm, to_user, body)."""
-        m = self._DM_HEADER_RE.match(content or "")
+        # Plain messages are the common case; skip the regex unless a header may follow
+        if not content or not content.startswith("[["):
+            return False, None, content
+        m = self._DM_HEADER_RE.match(content)
         if not m:
             return False, None, content
         to_user = m.group("to")
-        body = (content[m.end():] if content else "")
+        body = content[m.end():]
         return True, to_user, body
     
     def prepare_send_payload(self, content: str, target_cid: str) -> Tuple[str, str]:
@@ -152,6 +188,7 @@ class ConversationManager:
         manager = cls()
         manager._conversations = {}
         manager._conv_ids = data.get("conv_ids", ["global"])
+        manager._conv_index = {cid: i for i, cid in enumerate(manager._conv_ids)}
         manager._active_cid = data.get("active_cid", "global")
         
         for cid, conv_data in data.get("conversations", {}).items():
@@ -1,10 +1,12 @@
 """
 Persistence service for saving/loading state and logs.
 """
+import copy
 import json
 import os
+import threading
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 
 
 class PersistenceService:
@@ -14,28 +16,57 @@ class PersistenceService:
         self._log_dir = log_dir or os.path.join(os.getcwd(), "logs")
         os.makedirs(self._log_dir, exist_ok=True)
         self._state_path = os.path.join(self._log_dir, "gui_state.json")
+        # Last state read from/written to disk, keyed by the file's mtime
+        self._state_cache: Optional[Dict[str, Any]] = None
+        self._state_mtime: Optional[int] = None
+        # Loads run on the Tk thread and saves on the io worker; the lock keeps
+        # the file and its cache entry changing together
+        self._state_lock = threading.Lock()
     
     @property
     def log_dir(self) -> str:
         """Get log directory path."""
         return self._log_dir
     
-    def load_state(self) -> Dict[str, Any]:
-        """Load application state from disk."""
+    def _current_mtime(self) -> Optional[int]:
+        """Get the state file's mtime, or None if it does not exist."""
         try:
-            with open(self._state_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
+            return os.stat(self._state_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def load_state(self) -> Dict[str, Any]:
+        """Load application state from disk.
+        
+        The file is only re-parsed when its mtime differs from the last load/save.
+        """
+        with self._state_lock:
+            mtime = self._current_mtime()
+            if mtime is not None and mtime == self._state_mtime and self._state_cache is not None:
+                return copy.deepcopy(self._state_cache)
+            try:
+                with open(self._state_path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+            except Exception:
+                return {}
+            self._state_cache = state
+            self._state_mtime = mtime
+            return copy.deepcopy(state)
     
     def save_state(self, state: Dict[str, Any]) -> bool:
-        """Save application state to disk."""
-        try:
-            with open(self._state_path, "w", encoding="utf-8") as f:
-                json.dump(state, f, ensure_ascii=False, indent=2)
+        """Save application state to disk, skipping the write if nothing changed."""
+        with self._state_lock:
+            if (self._state_cache is not None and state == self._state_cache
+                    and self._current_mtime() == self._state_mtime):
+                return True
+            try:
+                with open(self._state_path, "w", encoding="utf-8") as f:
+                    json.dump(state, f, ensure_ascii=False, indent=2)
+            except Exception:
+                return False
+            self._state_cache = copy.deepcopy(state)
+            self._state_mtime = self._current_mtime()
             return True
-        except Exception:
-            return False
     
     def log_chat(self, username: str, sender: str, content: str) -> bool:
         """Append chat log to a daily file."""
@@ -51,6 +82,21 @@ class PersistenceService:
         except Exception:
             return False
     
+    def log_chat_many(self, username: str, rows: Iterable[Tuple[str, str]]) -> bool:
+        """Append several (sender, content) chat log lines with a single file open."""
+        try:
+            now = datetime.now()
+            user = username or "unknown"
+            path = os.path.join(self._log_dir, f"chat_{user}_{now.strftime('%Y%m%d')}.txt")
+            ts = now.strftime("%Y-%m-%d %H:%M:%S")
+            lines = [f"[{ts}] {sender}: {content}\n" for sender, content in rows]
+            if lines:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            return True
+        except Exception:
+            return False
+    
     def export_conversation_md(self, username: str, cid: str, 
                                name: str, items: list) -> Optional[str]:
         """Export conversation to Markdown file."""
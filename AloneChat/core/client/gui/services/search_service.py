@@ -1,7 +1,8 @@
 """
 Search service for finding messages.
 """
-from typing import List, Optional
+import re
+from typing import List, Optional, Pattern
 
 from ..components.message_card import WinUI3MessageCard
 
@@ -14,6 +15,9 @@ class SearchService:
         self._search_hits: List[int] = []
         self._search_idx: int = -1
         self._query: str = ""
+        self._pattern: Optional[Pattern[str]] = None
+        # Card index currently shown with the strong highlight
+        self._focused: Optional[int] = None
     
     def set_message_cards(self, cards: List[WinUI3MessageCard]) -> None:
         """Update the list of message cards to search."""
@@ -22,21 +26,33 @@ class SearchService:
     
     def search(self, query: str) -> int:
         """Perform search and return number of hits."""
-        self._query = query.strip().lower()
-        self._recompute()
+        query = query.strip().lower()
+        # Edits that normalize to the same query (e.g. a trailing space) keep
+        # the current hits and focus; set_message_cards keeps them up to date
+        if query == self._query:
+            return len(self._search_hits)
+        # A longer query can only match a subset of the current hits
+        narrowing = bool(self._query) and query.startswith(self._query)
+        self._pattern = re.compile(re.escape(query), re.IGNORECASE) if query else None
+        self._query = query
+        self._recompute(self._search_hits if narrowing else None)
         return len(self._search_hits)
     
-    def _recompute(self) -> None:
-        """Recompute search hits."""
+    def _recompute(self, candidates: Optional[List[int]] = None) -> None:
+        """Recompute search hits, optionally only among ``candidates``."""
         self._clear_highlight()
         self._search_hits = []
         self._search_idx = -1
         
-        if not self._query:
+        if not self._pattern:
             return
         
-        for i, card in enumerate(self._message_cards):
-            if self._query in (card.content or "").lower():
+        cards = self._message_cards
+        search = self._pattern.search
+        indices = candidates if candidates is not None else range(len(cards))
+        for i in indices:
+            card = cards[i]
+            if search(card.content or ""):
                 self._search_hits.append(i)
                 card.set_highlight(True, strong=False)
         
@@ -61,21 +77,22 @@ class SearchService:
         return self._search_hits[self._search_idx]
     
     def _focus_current(self) -> None:
-        """Highlight current hit and dim others."""
+        """Highlight current hit and dim the previously focused one."""
         if not self._search_hits:
             return
         
         idx = self._search_hits[self._search_idx]
-        for i, card in enumerate(self._message_cards):
-            if i == idx:
-                card.set_highlight(True, strong=True)
-            elif i in self._search_hits:
-                card.set_highlight(True, strong=False)
+        cards = self._message_cards
+        if self._focused is not None and self._focused != idx and self._focused < len(cards):
+            cards[self._focused].set_highlight(True, strong=False)
+        cards[idx].set_highlight(True, strong=True)
+        self._focused = idx
     
     def _clear_highlight(self) -> None:
         """Clear all highlights."""
         for card in self._message_cards:
             card.set_highlight(False)
+        self._focused = None
     
     def clear(self) -> None:
         """Clear search state."""
@@ -83,6 +100,7 @@ class SearchService:
         self._search_hits = []
         self._search_idx = -1
         self._query = ""
+        self._pattern = None
     
     def get_current_hit_widget(self) -> Optional[WinUI3MessageCard]:
         """Get the currently highlighted message card."""
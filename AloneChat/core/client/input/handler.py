@@ -15,6 +15,7 @@ class InputResult(Enum):
     HANDLED = auto()
     SUBMIT = auto()
     QUIT = auto()
+    RESIZE = auto()
     ERROR = auto()
 
 
@@ -126,6 +127,9 @@ class InputHandler:
                 self._running = False
                 return InputResult.QUIT
 
+            case InputAction.RESIZE:
+                return InputResult.RESIZE
+
             case InputAction.HELP:
                 # Could show help message
                 return InputResult.HANDLED
@@ -36,6 +36,9 @@ class KeyCode:
     F3 = curses.KEY_F3 if 'curses' in globals() else 267
     F4 = curses.KEY_F4 if 'curses' in globals() else 268
 
+    # Terminal resize notification
+    RESIZE = curses.KEY_RESIZE if 'curses' in globals() else 410
+
 
 class InputAction(Enum):
     """Semantic actions that can result from key presses."""
@@ -55,6 +58,7 @@ class InputAction(Enum):
     # Commands
     QUIT = auto()
     HELP = auto()
+    RESIZE = auto()
     UNKNOWN = auto()
     IGNORE = auto()
 
@@ -62,6 +66,9 @@ class InputAction(Enum):
 # Import curses for key constants
 import curses
 
+# Key codes 0-255 that map to a printable character
+PRINTABLE = frozenset(i for i in range(256) if chr(i).isprintable())
+
 # Update KeyCode with actual curses values
 KeyCode.DELETE = curses.KEY_DC
 KeyCode.UP = curses.KEY_UP
@@ -76,6 +83,7 @@ KeyCode.F1 = curses.KEY_F1
 KeyCode.F2 = curses.KEY_F2
 KeyCode.F3 = curses.KEY_F3
 KeyCode.F4 = curses.KEY_F4
+KeyCode.RESIZE = curses.KEY_RESIZE
 
 
 def get_action_for_key(key: int) -> InputAction:
@@ -121,12 +129,16 @@ def get_action_for_key(key: int) -> InputAction:
         case KeyCode.F1 | curses.KEY_F1:
             return InputAction.HELP
 
+        # Terminal was resized
+        case KeyCode.RESIZE:
+            return InputAction.RESIZE
+
         # Escape / Quit
         case KeyCode.ESCAPE:
             return InputAction.QUIT
 
         # Printable characters
-        case k if 0 < k < 256 and chr(k).isprintable():
+        case k if k in PRINTABLE:
             return InputAction.TYPE_CHAR
 
         # Ignore everything else
@@ -144,7 +156,7 @@ def is_printable(key: int) -> bool:
     Returns:
         True if printable, False otherwise
     """
-    return 0 < key < 256 and chr(key).isprintable()
+    return key in PRINTABLE
 
 
 def get_char(key: int) -> str:
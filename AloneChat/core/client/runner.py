@@ -3,7 +3,6 @@ Client runner module for AloneChat.
 Provides simplified entry point for starting chat clients.
 """
 
-from AloneChat.core.client import CursesClient, SimpleGUIClient
 from AloneChat.core.client.utils import DEFAULT_HOST, DEFAULT_API_PORT
 
 __all__ = ['run_client']
@@ -24,9 +23,11 @@ def run_client(api_host=DEFAULT_HOST, api_port=DEFAULT_API_PORT, ui="gui"):
     
     try:
         if ui == "gui":
+            from AloneChat.core.client.gui_client import SimpleGUIClient
             client = SimpleGUIClient(api_host, api_port)
             client.run()
         elif ui == "tui":
+            from AloneChat.core.client.curses_client import CursesClient
             client = CursesClient(api_host, api_port)
             client.run()
         else:
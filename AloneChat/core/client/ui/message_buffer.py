@@ -3,9 +3,18 @@ Message buffer management for curses client.
 Handles message storage, scrolling, and navigation.
 """
 
+import sys
+import time
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple
+
+# Curses color pair per sender (see CursesRenderer._init_color_pairs);
+# anyone else is drawn as a user message
+_SENDER_COLORS = {"System": 1, "! Error": 2}
+_USER_COLOR = 3
 
 
 class ScrollDirection(Enum):
@@ -18,16 +27,16 @@ class ScrollDirection(Enum):
     PAGE_DOWN = "page_down"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a chat message."""
     sender: str
     content: str
     timestamp: Optional[float] = None
+    color_pair: int = 0
 
     def __post_init__(self):
         if self.timestamp is None:
-            import time
             self.timestamp = time.time()
 
     def format(self) -> str:
@@ -48,19 +57,41 @@ class MessageBuffer:
         Args:
             max_history: Maximum number of messages to keep in history
         """
-        self._messages: List[Message] = []
+        # History is kept column-wise in parallel bounded deques; appending to
+        # full deques evicts the oldest message from all of them together.
+        # _rows holds the ready-to-draw (formatted text, color pair) per message.
+        self._senders: Deque[str] = deque(maxlen=max_history)
+        self._contents: Deque[str] = deque(maxlen=max_history)
+        self._timestamps: Deque[float] = deque(maxlen=max_history)
+        self._rows: Deque[Tuple[str, int]] = deque(maxlen=max_history)
+        # Per sender: ("[sender] " display prefix, color pair)
+        self._sender_styles: Dict[str, Tuple[str, int]] = {}
         self._scroll_offset: int = 0
+        # Messages evicted since the scroll offset was last adjusted for them
+        self._evicted: int = 0
         self._auto_scroll: bool = True
         self._max_history: int = max_history
+        # Bumped on every change that can affect what is displayed
+        self._version: int = 0
 
     @property
     def messages(self) -> List[Message]:
-        """Get all messages."""
-        return self._messages.copy()
+        """Get all messages (built on demand from the stored columns)."""
+        return [
+            Message(sender=sender, content=content, timestamp=timestamp, color_pair=color_pair)
+            for sender, content, timestamp, (_, color_pair)
+            in zip(self._senders, self._contents, self._timestamps, self._rows)
+        ]
+
+    @property
+    def version(self) -> int:
+        """Get a counter that changes whenever the visible content may have changed."""
+        return self._version
 
     @property
     def scroll_offset(self) -> int:
         """Get current scroll offset."""
+        self._apply_evictions()
         return self._scroll_offset
 
     @property
@@ -72,6 +103,7 @@ class MessageBuffer:
     def auto_scroll(self, value: bool) -> None:
         """Set auto-scroll state."""
         self._auto_scroll = value
+        self._version += 1
 
     def add_message(self, sender: str, content: str) -> None:
         """
@@ -81,15 +113,28 @@ class MessageBuffer:
             sender: Message sender
             content: Message content
         """
-        message = Message(sender=sender, content=content)
-        self._messages.append(message)
-
-        # Trim history if exceeds max
-        if len(self._messages) > self._max_history:
-            self._messages = self._messages[-self._max_history:]
-            # Adjust scroll offset if needed
-            if self._scroll_offset > 0:
-                self._scroll_offset = max(0, self._scroll_offset - 1)
+        # A full buffer drops its oldest message on append
+        self._evicted += len(self._rows) == self._max_history
+        # One shared copy of each sender name across the history
+        sender = sys.intern(sender)
+        style = self._sender_styles.get(sender)
+        if style is None:
+            style = self._sender_styles[sender] = (
+                f"[{sender}] ", _SENDER_COLORS.get(sender, _USER_COLOR)
+            )
+        prefix, color_pair = style
+
+        self._senders.append(sender)
+        self._contents.append(content)
+        self._timestamps.append(time.time())
+        self._rows.append((prefix + content, color_pair))
+        self._version += 1
+
+    def _apply_evictions(self) -> None:
+        """Shift the scroll offset back by pending evictions so the view stays on the same messages."""
+        if self._evicted:
+            self._scroll_offset = max(0, self._scroll_offset - self._evicted)
+            self._evicted = 0
 
     def add_system_message(self, content: str) -> None:
         """
@@ -109,7 +154,7 @@ class MessageBuffer:
         """
         self.add_message("! Error", content)
 
-    def get_visible_messages(self, display_height: int) -> List[str]:
+    def get_visible_messages(self, display_height: int) -> List[Tuple[str, int]]:
         """
         Get messages visible in the current view.
 
@@ -117,15 +162,16 @@ class MessageBuffer:
             display_height: Height of the display area
 
         Returns:
-            List of formatted message strings
+            List of (formatted message, color pair) tuples
         """
+        self._apply_evictions()
         if self._auto_scroll:
-            self._scroll_offset = max(0, len(self._messages) - display_height)
+            self._scroll_offset = max(0, len(self._rows) - display_height)
 
         start_idx = max(0, self._scroll_offset)
-        end_idx = min(len(self._messages), start_idx + display_height)
+        end_idx = min(len(self._rows), start_idx + display_height)
 
-        return [msg.format() for msg in self._messages[start_idx:end_idx]]
+        return list(islice(self._rows, start_idx, end_idx))
 
     def scroll(self, direction: ScrollDirection, display_height: int) -> None:
         """
@@ -135,42 +181,59 @@ class MessageBuffer:
             direction: Direction to scroll
             display_height: Height of the display area
         """
-        max_offset = max(0, len(self._messages) - display_height)
-
-        match direction:
-            case ScrollDirection.UP:
-                if self._scroll_offset > 0:
-                    self._scroll_offset -= 1
-                self._auto_scroll = False
-
-            case ScrollDirection.DOWN:
-                if self._scroll_offset < max_offset:
-                    self._scroll_offset += 1
-                if self._scroll_offset >= max_offset:
-                    self._auto_scroll = True
-
-            case ScrollDirection.PAGE_UP:
-                self._scroll_offset = max(0, self._scroll_offset - display_height)
-                self._auto_scroll = False
-
-            case ScrollDirection.PAGE_DOWN:
-                self._scroll_offset = min(max_offset, self._scroll_offset + display_height)
-                if self._scroll_offset >= max_offset:
-                    self._auto_scroll = True
+        self._apply_evictions()
+        max_offset = max(0, len(self._rows) - display_height)
+        self._version += 1
+        self._SCROLL_HANDLERS[direction](self, display_height, max_offset)
+
+    def _scroll_up(self, display_height: int, max_offset: int) -> None:
+        if self._scroll_offset > 0:
+            self._scroll_offset -= 1
+        self._auto_scroll = False
+
+    def _scroll_down(self, display_height: int, max_offset: int) -> None:
+        if self._scroll_offset < max_offset:
+            self._scroll_offset += 1
+        if self._scroll_offset >= max_offset:
+            self._auto_scroll = True
+
+    def _scroll_page_up(self, display_height: int, max_offset: int) -> None:
+        self._scroll_offset = max(0, self._scroll_offset - display_height)
+        self._auto_scroll = False
+
+    def _scroll_page_down(self, display_height: int, max_offset: int) -> None:
+        self._scroll_offset = min(max_offset, self._scroll_offset + display_height)
+        if self._scroll_offset >= max_offset:
+            self._auto_scroll = True
+
+    def _scroll_home(self, display_height: int, max_offset: int) -> None:
+        self._scroll_offset = 0
+        self._auto_scroll = False
 
-            case ScrollDirection.HOME:
-                self._scroll_offset = 0
-                self._auto_scroll = False
+    def _scroll_end(self, display_height: int, max_offset: int) -> None:
+        self._auto_scroll = True
 
-            case ScrollDirection.END:
-                self._auto_scroll = True
+    # Scroll handler per direction, dispatched with a single lookup
+    _SCROLL_HANDLERS = {
+        ScrollDirection.UP: _scroll_up,
+        ScrollDirection.DOWN: _scroll_down,
+        ScrollDirection.PAGE_UP: _scroll_page_up,
+        ScrollDirection.PAGE_DOWN: _scroll_page_down,
+        ScrollDirection.HOME: _scroll_home,
+        ScrollDirection.END: _scroll_end,
+    }
 
     def clear(self) -> None:
         """Clear all messages."""
-        self._messages.clear()
+        self._senders.clear()
+        self._contents.clear()
+        self._timestamps.clear()
+        self._rows.clear()
         self._scroll_offset = 0
+        self._evicted = 0
         self._auto_scroll = True
+        self._version += 1
 
     def __len__(self) -> int:
         """Return number of messages."""
-        return len(self._messages)
+        return len(self._rows)
@@ -4,10 +4,38 @@ Handles all screen drawing and display operations.
 """
 
 import curses
-from typing import Optional, List
+import time
+import unicodedata
+from typing import Optional, List, Tuple
 
+from ..input.key_mappings import PRINTABLE
 from .message_buffer import MessageBuffer
 
+# Control characters (newline, tab, escape, ...) would move the cursor or
+# expand on screen; they are drawn as a single space instead
+_CONTROL_TO_SPACE = {c: " " for c in [*range(0x20), *range(0x7f, 0xa0)]}
+
+
+def _clip_to_width(text: str, width: int) -> str:
+    """
+    Make text safe to draw on one row of ``width`` terminal cells.
+
+    Control characters become spaces and the text is cut at the display
+    width, counting wide (East Asian) characters as two cells and
+    combining marks as none.
+    """
+    if text.isascii() and text.isprintable():
+        return text[:width]
+    text = text.translate(_CONTROL_TO_SPACE)
+    cells = 0
+    for i, ch in enumerate(text):
+        if unicodedata.combining(ch):
+            continue
+        cells += 2 if unicodedata.east_asian_width(ch) in "WF" else 1
+        if cells > width:
+            return text[:i]
+    return text
+
 
 class CursesRenderer:
     """
@@ -25,6 +53,17 @@ class CursesRenderer:
         self._stdscr = stdscr
         self._height: int = 0
         self._width: int = 0
+        # Set by on_resize(); dimensions are re-read from curses only then
+        self._dims_dirty: bool = True
+        # What update_display last drew: (text, color pair) per message row
+        # and the input line; empty/None means the screen content is unknown
+        self._shadow: List[Optional[Tuple[str, int]]] = []
+        self._shadow_input: Optional[str] = None
+        # Buffer row each shadow row was drawn from; an identical row object
+        # means the (already truncated) drawn text is still current
+        self._shadow_src: List[Optional[Tuple[str, int]]] = []
+        # (buffer, buffer version, input) of the last frame update_display drew
+        self._last_frame: Optional[Tuple[int, int, str]] = None
         self._init_curses()
 
     def _init_curses(self) -> None:
@@ -54,17 +93,24 @@ class CursesRenderer:
     def _update_dimensions(self) -> None:
         """Update stored screen dimensions."""
         self._height, self._width = self._stdscr.getmaxyx()
+        self._dims_dirty = False
+
+    def on_resize(self) -> None:
+        """Note a terminal resize (curses.KEY_RESIZE); dimensions are re-read on next use."""
+        self._dims_dirty = True
 
     @property
     def height(self) -> int:
         """Get screen height."""
-        self._update_dimensions()
+        if self._dims_dirty:
+            self._update_dimensions()
         return self._height
 
     @property
     def width(self) -> int:
         """Get screen width."""
-        self._update_dimensions()
+        if self._dims_dirty:
+            self._update_dimensions()
         return self._width
 
     @property
@@ -75,57 +121,74 @@ class CursesRenderer:
     def clear(self) -> None:
         """Clear the screen."""
         self._stdscr.clear()
+        self._invalidate_shadow()
+
+    def _invalidate_shadow(self) -> None:
+        """Force the next update_display to redraw every row."""
+        self._shadow = []
+        self._shadow_input = None
+        self._shadow_src = []
+        self._last_frame = None
 
     def refresh(self) -> None:
-        """Refresh the screen."""
-        self._stdscr.refresh()
+        """Stage the window contents; nothing reaches the terminal until flush()."""
+        self._stdscr.noutrefresh()
 
-    def draw_message_area(self, messages: List[str]) -> None:
-        """
-        Draw the message display area.
+    @staticmethod
+    def flush() -> None:
+        """Write all staged changes to the terminal in one update."""
+        curses.doupdate()
 
-        Args:
-            messages: List of message strings to display
+    def draw_message_area(self, messages: List[Tuple[str, int]]) -> None:
         """
-        display_height = self.display_height
-
-        for i, message in enumerate(messages):
-            if i >= display_height:
-                break
-
-            # Truncate message if too long
-            display_msg = message[:self._width - 1]
-
-            # Apply color based on message type
-            color_pair = self._get_message_color(message)
-
-            try:
-                if color_pair:
-                    self._stdscr.addstr(i, 0, display_msg, curses.color_pair(color_pair))
-                else:
-                    self._stdscr.addstr(i, 0, display_msg)
-            except curses.error:
-                # Ignore errors for edge cases
-                pass
+        Draw the message display area.
 
-    @staticmethod
-    def _get_message_color(message: str) -> Optional[int]:
-        """
-        Determine color pair for a message.
+        Only rows whose text or color differ from the last drawn frame are
+        rewritten; rows past the end of ``messages`` are blanked. Rows showing
+        the same buffer entry as last frame are skipped without re-truncating.
+        Rows are clipped to one screen line before being compared, so the
+        shadow always holds exactly what is on screen.
 
         Args:
-            message: Message string
-
-        Returns:
-            Color pair number or None for default
+            messages: (message string, color pair) tuples to display
         """
-        if message.startswith("[System]"):
-            return 1
-        elif message.startswith("[! Error]"):
-            return 2
-        elif message.startswith("["):
-            return 3
-        return None
+        display_height = self.display_height
+        if len(self._shadow) != display_height:
+            self._shadow = [None] * display_height
+            self._shadow_src = [None] * display_height
+        shadow = self._shadow
+        shadow_src = self._shadow_src
+        trunc_width = self._width - 1
+        count = len(messages)
+
+        for i in range(display_height):
+            if i < count:
+                src = messages[i]
+                if src is shadow_src[i]:
+                    continue
+                shadow_src[i] = src
+                message, color_pair = src
+                row = (_clip_to_width(message, trunc_width), color_pair)
+            else:
+                shadow_src[i] = None
+                row = ("", 0)
+
+            if shadow[i] == row:
+                continue
+            shadow[i] = row
+            self._write_row(i, row[0], row[1])
+
+    def _write_row(self, y: int, text: str, color_pair: int) -> None:
+        """Write one message row at column 0 and clear the rest of the line."""
+        try:
+            if color_pair:
+                self._stdscr.addstr(y, 0, text, curses.color_pair(color_pair))
+            else:
+                self._stdscr.addstr(y, 0, text)
+            self._stdscr.clrtoeol()
+        except curses.error:
+            # Ignore errors for edge cases
+            pass
 
     def draw_input_line(self, input_buffer: str, prompt: str = "> ") -> None:
         """
@@ -139,7 +202,11 @@ class CursesRenderer:
         display_input = input_line[:self._width - 1]
 
         try:
-            self._stdscr.addstr(self._height - 1, 0, display_input)
+            if display_input != self._shadow_input:
+                self._stdscr.move(self._height - 1, 0)
+                self._stdscr.clrtoeol()
+                self._stdscr.addstr(self._height - 1, 0, display_input)
+                self._shadow_input = display_input
 
             # Position cursor at end of input
             cursor_pos = min(len(input_line), self._width - 1)
@@ -165,6 +232,7 @@ class CursesRenderer:
                 pass
 
         self.refresh()
+        self.flush()
 
     def draw_input_field(self, y: int, x: int, label: str, value: str = "", mask: bool = False) -> None:
         """
@@ -177,6 +245,7 @@ class CursesRenderer:
             value: Current value
             mask: Whether to mask the value (for passwords)
         """
+        self._invalidate_shadow()
         display_value = "*" * len(value) if mask else value
         line = f"{label}{display_value}"
 
@@ -188,13 +257,26 @@ class CursesRenderer:
 
     def update_display(self, message_buffer: MessageBuffer, input_buffer: str) -> None:
         """
-        Update the entire display.
+        Update the display, rewriting only rows that changed since the last call.
+
+        Returns without drawing when neither the buffer, the input nor the
+        terminal size changed, so idle render ticks cost a single comparison.
 
         Args:
             message_buffer: Buffer containing messages to display
             input_buffer: Current input text
         """
-        self.clear()
+        if self._dims_dirty:
+            height, width = self._height, self._width
+            self._update_dimensions()
+            if (height, width) != (self._height, self._width):
+                # Terminal was resized: start again from a blank screen
+                self.clear()
+
+        frame = (id(message_buffer), message_buffer.version, input_buffer)
+        if frame == self._last_frame:
+            return
+        self._last_frame = frame
 
         # Get visible messages
         messages = message_buffer.get_visible_messages(self.display_height)
@@ -206,6 +288,7 @@ class CursesRenderer:
         self.draw_input_line(input_buffer)
 
         self.refresh()
+        self.flush()
 
     def get_input_at_position(self, y: int, x: int, initial: str = "", mask: bool = False) -> str:
         """
@@ -220,19 +303,22 @@ class CursesRenderer:
         Returns:
             Entered string
         """
-        input_str = initial
+        # Characters are collected in a list and joined once at the end
+        chars = list(initial)
+        self._invalidate_shadow()
         self._stdscr.nodelay(False)  # Blocking input for this operation
 
         try:
             while True:
                 # Redraw current state
-                display_value = "*" * len(input_str) if mask else input_str
+                display_value = "*" * len(chars) if mask else "".join(chars)
                 try:
                     self._stdscr.move(y, x)
                     self._stdscr.clrtoeol()
                     self._stdscr.addstr(y, x, display_value)
                     self._stdscr.move(y, x + len(display_value))
                     self.refresh()
+                    self.flush()
                 except curses.error:
                     pass
 
@@ -241,15 +327,15 @@ class CursesRenderer:
                 if key in [curses.KEY_ENTER, 10, 13]:  # Enter
                     break
                 elif key in [curses.KEY_BACKSPACE, 8, 127]:  # Backspace
-                    if input_str:
-                        input_str = input_str[:-1]
-                elif 0 < key < 256 and chr(key).isprintable():
-                    input_str += chr(key)
+                    if chars:
+                        chars.pop()
+                elif key in PRINTABLE:
+                    chars.append(chr(key))
 
         finally:
             self._stdscr.nodelay(True)  # Restore non-blocking mode
 
-        return input_str
+        return "".join(chars)
 
     def show_error(self, message: str, duration: float = 2.0) -> None:
         """
@@ -259,11 +345,12 @@ class CursesRenderer:
             message: Error message to display
             duration: Duration to show message in seconds
         """
+        self._invalidate_shadow()
         try:
             self._stdscr.addstr(self._height // 2, 0, f"Error: {message}",
                                curses.color_pair(2) if curses.has_colors() else 0)
             self.refresh()
-            import time
+            self.flush()
             time.sleep(duration)
         except curses.error:
             pass
@@ -276,11 +363,12 @@ class CursesRenderer:
             message: Success message to display
             duration: Duration to show message in seconds
         """
+        self._invalidate_shadow()
         try:
             self._stdscr.addstr(self._height // 2, 0, message,
                                curses.color_pair(1) if curses.has_colors() else 0)
             self.refresh()
-            import time
+            self.flush()
             time.sleep(duration)
         except curses.error:
             pass
@@ -15,6 +15,10 @@ Usage:
     logger.info("Application started")
     logger.error("An error occurred", exc_info=True)
 
+    # Pass arguments separately rather than pre-formatting with f-strings:
+    # the message is only built if the record passes the level check
+    logger.debug("Received %d bytes from %s", size, peer)
+
 Configuration:
     from AloneChat.core.logging import configure_logging, LogConfig
     
@@ -27,9 +31,13 @@ Configuration:
     configure_logging(config)
 """
 
+import atexit
+import copy
+import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -92,14 +100,23 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, fmt: str, datefmt: str = None, use_colors: bool = True):
         super().__init__(fmt, datefmt)
         self.use_colors = use_colors and sys.platform != 'win32'
+        # Colored level names, built once rather than per record
+        self._wrapped = {
+            level: f"{color}{level}{self.COLORS['RESET']}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
     
     def format(self, record: logging.LogRecord) -> str:
-        if self.use_colors:
-            levelname = record.levelname
-            if levelname in self.COLORS:
-                record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        if not self.use_colors:
+            return super().format(record)
         
-        return super().format(record)
+        # Color only this handler's output; other handlers see the plain name
+        levelname = record.levelname
+        record.levelname = self._wrapped.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 class JsonFormatter(logging.Formatter):
@@ -108,9 +125,10 @@ class JsonFormatter(logging.Formatter):
     Useful for structured logging and log aggregation.
     """
     
+    # Shared encoder; non-JSON values are written as their str()
+    _ENCODER = json.JSONEncoder(default=str)
+    
     def format(self, record: logging.LogRecord) -> str:
-        import json
-        
         log_data = {
             'timestamp': datetime.fromtimestamp(record.created).isoformat(),
             'level': record.levelname,
@@ -127,7 +145,26 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, 'extra_data'):
             log_data.update(record.extra_data)
         
-        return json.dumps(log_data, default=str)
+        return self._ENCODER.encode(log_data)
+
+
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the handlers behind the listener.
+    
+    The stock prepare() formats the whole record on the calling thread and
+    drops exc_info, folding the traceback into the message. Here only the
+    message arguments are merged on the calling thread, since they may
+    change once the call returns; timestamps, tracebacks and colors are
+    rendered by each handler's formatter on the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Copy so handlers attached next to the queue see the original record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def get_default_format() -> str:
@@ -165,7 +202,13 @@ class LoggingManager:
         
         self._config: Optional[LogConfig] = None
         self._handlers: List[logging.Handler] = []
+        # Drains queued records to the console/file handlers on a background
+        # thread; _queue_handler is what feeds it from the root logger
+        self._queue_listener: Optional[logging.handlers.QueueListener] = None
+        self._queue_handler: Optional[logging.Handler] = None
         self._initialized = True
+        # Runs before logging's own atexit shutdown, so queued records are written
+        atexit.register(self._stop_queue_listener)
     
     def configure(self, config: LogConfig) -> None:
         """
@@ -185,6 +228,7 @@ class LoggingManager:
         root_logger.setLevel(getattr(logging, config.level.upper()))
         
         # Remove existing handlers
+        self._stop_queue_listener()
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
         
@@ -199,7 +243,6 @@ class LoggingManager:
             formatter = ColoredFormatter(fmt, config.date_format)
             console_handler.setFormatter(formatter)
             
-            root_logger.addHandler(console_handler)
             self._handlers.append(console_handler)
         
         # Add file handler with rotation
@@ -217,7 +260,6 @@ class LoggingManager:
             formatter = logging.Formatter(fmt, config.date_format)
             file_handler.setFormatter(formatter)
             
-            root_logger.addHandler(file_handler)
             self._handlers.append(file_handler)
             
             # Add error file handler for errors only
@@ -231,9 +273,20 @@ class LoggingManager:
             error_handler.setLevel(logging.ERROR)
             error_handler.setFormatter(formatter)
             
-            root_logger.addHandler(error_handler)
             self._handlers.append(error_handler)
         
+        # The handlers above sit behind a queue: logging calls only merge
+        # the message arguments and enqueue the record; formatting plus
+        # console/file I/O happen on the listener thread
+        if self._handlers:
+            log_queue = queue.SimpleQueue()
+            self._queue_listener = logging.handlers.QueueListener(
+                log_queue, *self._handlers, respect_handler_level=True
+            )
+            self._queue_listener.start()
+            self._queue_handler = _DeferredFormatQueueHandler(log_queue)
+            root_logger.addHandler(self._queue_handler)
+        
         # Configure component-specific levels
         for component, level in config.component_levels.items():
             component_logger = logging.getLogger(component)
@@ -283,7 +336,26 @@ class LoggingManager:
     def shutdown(self) -> None:
         """Shutdown the logging system gracefully."""
         logging.info("Shutting down logging system")
+        self._stop_queue_listener()
         logging.shutdown()
+    
+    def _stop_queue_listener(self) -> None:
+        """
+        Stop the listener thread after it has written all queued records.
+        
+        The handlers it served are attached to the root logger directly,
+        so records logged afterwards (e.g. during interpreter exit) are
+        still written rather than left in a queue nobody reads.
+        """
+        if self._queue_listener is None:
+            return
+        self._queue_listener.stop()
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self._queue_handler)
+        for handler in self._queue_listener.handlers:
+            root_logger.addHandler(handler)
+        self._queue_listener = None
+        self._queue_handler = None
 
 
 # Global logging manager instance
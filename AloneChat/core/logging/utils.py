@@ -6,18 +6,43 @@ Provides additional functionality for common logging patterns:
 - Context managers for scoped logging
 - Request/response logging
 - Exception tracking
+
+Records from these helpers go through the queue installed by
+LoggingManager.configure(), so the caller never waits on handler I/O.
 """
 
 import functools
 import logging
+import threading
 import time
+from collections import Counter
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from AloneChat.core.logging import get_logger
 
 F = TypeVar('F', bound=Callable[..., Any])
 
+# Default logger for helpers created without an explicit one
+_LOGGER = get_logger(__name__)
+
+
+class _LazyArgs:
+    """Renders call arguments only when a handler formats the record."""
+    
+    __slots__ = ('args', 'kwargs')
+    
+    def __init__(self, args: tuple, kwargs: Dict[str, Any]):
+        self.args = args
+        self.kwargs = kwargs
+    
+    def __str__(self) -> str:
+        return ", ".join([
+            str(a) for a in self.args
+        ] + [
+            f"{k}={v}" for k, v in self.kwargs.items()
+        ])
+
 
 class LogTimer:
     """
@@ -43,7 +68,7 @@ class LogTimer:
             level: Log level for the timing message
         """
         self.operation = operation
-        self.logger = logger or get_logger(__name__)
+        self.logger = logger or _LOGGER
         self.level = level
         self.start_time: Optional[float] = None
         self.duration: Optional[float] = None
@@ -74,7 +99,8 @@ class LogTimer:
 def timed(
     operation: Optional[str] = None,
     logger: Optional[logging.Logger] = None,
-    level: int = logging.DEBUG
+    level: int = logging.DEBUG,
+    metrics: Optional['MetricsCollector'] = None
 ) -> Callable[[F], F]:
     """
     Decorator to time function execution and log the duration.
@@ -83,12 +109,15 @@ def timed(
         operation: Name of the operation (defaults to function name)
         logger: Logger to use
         level: Log level for the timing message
+        metrics: Collector that also receives the duration of successful
+            calls under the operation name, so call sites need no
+            separate record_timing()
         
     Returns:
         Decorator function
         
     Example:
-        @timed("database_query")
+        @timed("database_query", metrics=collector)
         def fetch_data():
             return db.query()
     """
@@ -98,21 +127,38 @@ def timed(
             operation = func.__name__
         
         log = logger or get_logger(func.__module__)
+        # Resolved once here rather than on every call of the wrapper
+        log_at = log.log
+        is_enabled = log.isEnabledFor
+        perf_counter = time.perf_counter
+        record_timing = metrics.record_timing if metrics is not None else None
         
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.perf_counter()
+            enabled = is_enabled(level)
+            # Only time the call when someone consumes the duration
+            if not enabled and record_timing is None:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    log.error("Operation '%s' failed: %s", operation, e)
+                    raise
+            
+            start_time = perf_counter()
             try:
                 result = func(*args, **kwargs)
-                duration = time.perf_counter() - start_time
-                log.log(
-                    level,
-                    "Operation '%s' completed in %.4f seconds",
-                    operation, duration
-                )
+                duration = perf_counter() - start_time
+                if record_timing is not None:
+                    record_timing(operation, duration)
+                if enabled:
+                    log_at(
+                        level,
+                        "Operation '%s' completed in %.4f seconds",
+                        operation, duration
+                    )
                 return result
             except Exception as e:
-                duration = time.perf_counter() - start_time
+                duration = perf_counter() - start_time
                 log.error(
                     "Operation '%s' failed after %.4f seconds: %s",
                     operation, duration, e
@@ -137,7 +183,7 @@ class RequestLogger:
         Args:
             logger: Logger to use
         """
-        self.logger = logger or get_logger(__name__)
+        self.logger = logger or _LOGGER
     
     def log_request(
         self,
@@ -158,14 +204,35 @@ class RequestLogger:
             duration: Request duration in seconds
             user: Optional user identifier
             extra: Additional data to log
+            
+        The request fields are also attached as ``extra_data`` so that
+        JsonFormatter emits them as top-level keys.
         """
         level = logging.INFO if status_code < 400 else logging.WARNING
+        if not self.logger.isEnabledFor(level):
+            return
         
-        message = f"{method} {path} - {status_code} ({duration:.4f}s)"
+        fields = {
+            "method": method,
+            "path": path,
+            "status": status_code,
+            "duration": duration,
+        }
         if user:
-            message += f" - User: {user}"
+            fields["user"] = user
+        record_extra = dict(extra) if extra else {}
+        record_extra["extra_data"] = fields
         
-        self.logger.log(level, message, extra=extra or {})
+        if user:
+            self.logger.log(
+                level, "%s %s - %s (%.4fs) - User: %s",
+                method, path, status_code, duration, user, extra=record_extra
+            )
+        else:
+            self.logger.log(
+                level, "%s %s - %s (%.4fs)",
+                method, path, status_code, duration, extra=record_extra
+            )
     
     def log_websocket_event(
         self,
@@ -181,8 +248,6 @@ class RequestLogger:
             user: User identifier
             data: Additional event data
         """
-        message = f"WebSocket {event_type} - User: {user}"
-        
         if event_type == "connect":
             level = logging.INFO
         elif event_type == "disconnect":
@@ -192,7 +257,7 @@ class RequestLogger:
         else:
             level = logging.DEBUG
         
-        self.logger.log(level, message, extra=data or {})
+        self.logger.log(level, "WebSocket %s - User: %s", event_type, user, extra=data or {})
 
 
 @contextmanager
@@ -215,19 +280,20 @@ def log_context(
         with log_context("data_processing"):
             process_data()
     """
-    log = logger or get_logger(__name__)
+    log = logger or _LOGGER
     
     if enter_message is None:
-        enter_message = f"Starting: {operation}"
-    if exit_message is None:
-        exit_message = f"Completed: {operation}"
-    
-    log.debug(enter_message)
+        log.debug("Starting: %s", operation)
+    else:
+        log.debug(enter_message)
     try:
         yield
-        log.debug(exit_message)
+        if exit_message is None:
+            log.debug("Completed: %s", operation)
+        else:
+            log.debug(exit_message)
     except Exception as e:
-        log.error(f"Failed: {operation} - {e}")
+        log.error("Failed: %s - %s", operation, e)
         raise
 
 
@@ -245,7 +311,7 @@ class ExceptionLogger:
         Args:
             logger: Logger to use
         """
-        self.logger = logger or get_logger(__name__)
+        self.logger = logger or _LOGGER
     
     def log_exception(
         self,
@@ -262,9 +328,9 @@ class ExceptionLogger:
             level: Log level
         """
         if context:
-            self.logger.log(level, f"{context}: {exception}", exc_info=True)
+            self.logger.log(level, "%s: %s", context, exception, exc_info=True)
         else:
-            self.logger.log(level, str(exception), exc_info=True)
+            self.logger.log(level, "%s", exception, exc_info=True)
     
     def log_warning(self, message: str, exception: Optional[Exception] = None) -> None:
         """
@@ -275,7 +341,7 @@ class ExceptionLogger:
             exception: Optional exception to include
         """
         if exception:
-            self.logger.warning(f"{message}: {exception}")
+            self.logger.warning("%s: %s", message, exception)
         else:
             self.logger.warning(message)
 
@@ -305,32 +371,37 @@ def log_call(
     """
     def decorator(func: F) -> F:
         log = logger or get_logger(func.__module__)
+        # Resolved once here rather than on every call of the wrapper
+        log_at = log.log
+        is_enabled = log.isEnabledFor
+        func_name = func.__name__
         
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            func_name = func.__name__
+            # Skip building call/result messages that would be discarded
+            if not is_enabled(level):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    log.error("%s raised %s: %s", func_name, type(e).__name__, e)
+                    raise
             
             if log_args:
-                args_str = ", ".join([
-                    str(a) for a in args
-                ] + [
-                    f"{k}={v}" for k, v in kwargs.items()
-                ])
-                log.log(level, f"Calling {func_name}({args_str})")
+                log_at(level, "Calling %s(%s)", func_name, _LazyArgs(args, kwargs))
             else:
-                log.log(level, f"Calling {func_name}")
+                log_at(level, "Calling %s", func_name)
             
             try:
                 result = func(*args, **kwargs)
                 
                 if log_result:
-                    log.log(level, f"{func_name} returned: {result}")
+                    log_at(level, "%s returned: %s", func_name, result)
                 else:
-                    log.log(level, f"{func_name} completed successfully")
+                    log_at(level, "%s completed successfully", func_name)
                 
                 return result
             except Exception as e:
-                log.error(f"{func_name} raised {type(e).__name__}: {e}")
+                log.error("%s raised %s: %s", func_name, type(e).__name__, e)
                 raise
         
         return wrapper
@@ -342,6 +413,8 @@ class MetricsCollector:
     Collect and log application metrics.
     
     Tracks counts, timings, and other metrics for monitoring.
+    Safe to use from several threads; callers that count in a tight loop
+    can accumulate locally and commit with increment_many().
     """
     
     def __init__(self, logger: Optional[logging.Logger] = None):
@@ -351,9 +424,12 @@ class MetricsCollector:
         Args:
             logger: Logger to use
         """
-        self.logger = logger or get_logger(__name__)
-        self._counts: Dict[str, int] = {}
-        self._timings: Dict[str, list] = {}
+        self.logger = logger or _LOGGER
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        # Running [count, total, min, max] per metric; individual samples
+        # are not kept, so memory does not grow with the number of calls
+        self._timing_stats: Dict[str, List[float]] = {}
     
     def increment(self, metric: str, value: int = 1) -> None:
         """
@@ -363,7 +439,18 @@ class MetricsCollector:
             metric: Metric name
             value: Amount to increment
         """
-        self._counts[metric] = self._counts.get(metric, 0) + value
+        with self._lock:
+            self._counts[metric] += value
+    
+    def increment_many(self, deltas: Dict[str, int]) -> None:
+        """
+        Add a batch of counter increments under a single lock acquisition.
+        
+        Args:
+            deltas: Mapping of metric name to amount to increment
+        """
+        with self._lock:
+            self._counts.update(deltas)
     
     def record_timing(self, metric: str, duration: float) -> None:
         """
@@ -373,32 +460,51 @@ class MetricsCollector:
             metric: Metric name
             duration: Duration in seconds
         """
-        if metric not in self._timings:
-            self._timings[metric] = []
-        self._timings[metric].append(duration)
+        with self._lock:
+            stats = self._timing_stats.get(metric)
+            if stats is None:
+                stats = self._timing_stats[metric] = [0, 0.0, duration, duration]
+            stats[0] += 1
+            stats[1] += duration
+            if duration < stats[2]:
+                stats[2] = duration
+            elif duration > stats[3]:
+                stats[3] = duration
     
-    def log_summary(self) -> None:
-        """Log a summary of all collected metrics."""
-        if self._counts:
+    def log_summary(self, sort: bool = True) -> None:
+        """
+        Log a summary of all collected metrics.
+        
+        Args:
+            sort: List metrics by name; False keeps first-recorded order and
+                skips sorting, which is cheaper for large metric sets
+        """
+        # Snapshot under the lock; log outside it
+        with self._lock:
+            counts = list(self._counts.items())
+            timing_stats = [(m, tuple(st)) for m, st in self._timing_stats.items()]
+        if sort:
+            counts.sort()
+            timing_stats.sort()
+        
+        if counts:
             self.logger.info("=== Metrics Summary (Counts) ===")
-            for metric, count in sorted(self._counts.items()):
-                self.logger.info(f"  {metric}: {count}")
+            for metric, count in counts:
+                self.logger.info("  %s: %s", metric, count)
         
-        if self._timings:
+        if timing_stats:
             self.logger.info("=== Metrics Summary (Timings) ===")
-            for metric, timings in sorted(self._timings.items()):
-                if timings:
-                    avg = sum(timings) / len(timings)
-                    min_val = min(timings)
-                    max_val = max(timings)
-                    self.logger.info(
-                        f"  {metric}: avg={avg:.4f}s, min={min_val:.4f}s, max={max_val:.4f}s, count={len(timings)}"
-                    )
+            for metric, (count, total, min_val, max_val) in timing_stats:
+                self.logger.info(
+                    "  %s: avg=%.4fs, min=%.4fs, max=%.4fs, count=%d",
+                    metric, total / count, min_val, max_val, count
+                )
     
     def reset(self) -> None:
         """Reset all metrics."""
-        self._counts.clear()
-        self._timings.clear()
+        with self._lock:
+            self._counts.clear()
+            self._timing_stats.clear()
 
 
 __all__ = [
@@ -7,6 +7,62 @@ import json
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# The field layout never changes, so fill a prebuilt document with
+# escaped values instead of building and encoding a dict per message
+_MESSAGE_TEMPLATE = (
+    '{"type": %d, "sender": %s, "content": %s, "target": %s, "command": %s}'
+)
+_escape = json.encoder.encode_basestring_ascii
+
+
+def _json_value(value) -> str:
+    if type(value) is str:
+        return _escape(value)
+    if value is None:
+        return "null"
+    return json.dumps(value)
+
+
+def _encode_template(type_value: int, sender, content, target, command) -> str:
+    return _MESSAGE_TEMPLATE % (
+        type_value,
+        _json_value(sender),
+        _json_value(content),
+        _json_value(target),
+        _json_value(command)
+    )
+
+
+if orjson is not None:
+    def _encode(type_value: int, sender, content, target, command) -> str:
+        try:
+            return orjson.dumps({
+                "type": type_value,
+                "sender": sender,
+                "content": content,
+                "target": target,
+                "command": command
+            }).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects what json escapes, e.g. lone surrogates
+            return _encode_template(type_value, sender, content, target, command)
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Retried with json, which accepts e.g. escaped lone surrogates
+            # and raises the same error type for malformed documents
+            return json.loads(data)
+else:
+    _encode = _encode_template
+    _loads = json.loads
+
 
 class MessageType(Enum):
     """
@@ -20,7 +76,11 @@ class MessageType(Enum):
     ENCRYPTED = 6  # Encrypted message type
     HEARTBEAT = 7  # Heartbeat message
 
-@dataclass
+
+# Value -> member, avoiding Enum's call machinery when decoding messages
+_TYPE_BY_VALUE = {member.value: member for member in MessageType}
+
+@dataclass(slots=True)
 class Message:
     """
     Message class representing chat messages with type, sender, content and optional target.
@@ -44,28 +104,22 @@ class Message:
         Returns:
             str: JSON representation of the message
         """
-        return json.dumps({
-            "type": self.type.value,
-            "sender": self.sender,
-            "content": self.content,
-            "target": self.target,
-            "command": self.command
-        })
+        return _encode(self.type.value, self.sender, self.content, self.target, self.command)
 
     @classmethod
-    def deserialize(cls, data: str) -> 'Message':
+    def deserialize(cls, data: str | bytes) -> 'Message':
         """
         Create a Message object from JSON string.
 
         Args:
-            data (str): JSON string to deserialize
+            data (str | bytes): JSON document to deserialize
 
         Returns:
             Message: Deserialized message object
         """
-        obj = json.loads(data)
+        obj = _loads(data)
         return cls(
-            type=MessageType(obj["type"]),
+            type=_TYPE_BY_VALUE[obj["type"]],
             sender=obj["sender"],
             content=obj["content"],
             target=obj.get("target"),
@@ -77,73 +77,66 @@ The following legacy exports are maintained for backward compatibility:
 
 """
 
+import importlib
 import warnings
 
-from AloneChat.core.server import command as _command_module
-from AloneChat.core.server.auth import (
-    JWTAuthenticator,
-    AuthenticationMiddleware,
-    DefaultTokenExtractor,
-)
-from AloneChat.core.server.commands import (
-    CommandHandler,
-    CommandRegistry,
-    CommandProcessor,
-    CommandContext,
-    CommandPriority,
-    create_default_processor,
-)
-from AloneChat.core.server.interfaces import (
-    Authenticator,
-    AuthResult,
-    SessionStore,
-    TransportConnection,
-    MessageHandler,
-    BroadcastService,
-    ConnectionRegistry,
-    ServerLifecycle,
-    HookPhase,
-    HookContext,
-    HookFunction,
-    HookRegistry,
-    PluginAwareComponent,
-    ProcessingResult,
-    MessageProcessor,
-)
-from AloneChat.core.server.routing import (
-    MessageRouter,
-    BroadcastServiceImpl,
-    DeliveryResult,
-    DeliveryStatus,
-)
-from AloneChat.core.server.session import (
-    UserSession,
-    InMemorySessionStore,
-    SessionManager,
-)
-from AloneChat.core.server.transport import (
-    WebSocketConnection,
-    WebSocketConnectionRegistry,
-    ConnectionHealthMonitor,
-    TransportFactory,
-)
-from AloneChat.core.server.utils.helpers import (
-    MessageBuilder,
-    create_server_message,
-    create_error_message,
-    create_join_message,
-    create_leave_message,
-    SafeSender,
-)
-from AloneChat.core.server.websocket_manager import (
-    UnifiedWebSocketManager,
-    ConnectionContext,
-    MessageProcessingPipeline,
-    create_server,
-)
-
-COMMANDS = _command_module.COMMANDS
-CommandSystem = _command_module.CommandSystem
+# Public name -> submodule defining it. Submodules are imported on first
+# access, so importing this package stays cheap for callers that only need
+# a few of these names.
+_LAZY_ATTRS = {
+    'Authenticator': '.interfaces',
+    'AuthResult': '.interfaces',
+    'SessionStore': '.interfaces',
+    'TransportConnection': '.interfaces',
+    'MessageHandler': '.interfaces',
+    'BroadcastService': '.interfaces',
+    'ConnectionRegistry': '.interfaces',
+    'ServerLifecycle': '.interfaces',
+    'HookPhase': '.interfaces',
+    'HookContext': '.interfaces',
+    'HookFunction': '.interfaces',
+    'HookRegistry': '.interfaces',
+    'PluginAwareComponent': '.interfaces',
+    'ProcessingResult': '.interfaces',
+    'MessageProcessor': '.interfaces',
+    
+    'JWTAuthenticator': '.auth',
+    'AuthenticationMiddleware': '.auth',
+    'DefaultTokenExtractor': '.auth',
+    
+    'UserSession': '.session',
+    'InMemorySessionStore': '.session',
+    'SessionManager': '.session',
+    
+    'WebSocketConnection': '.transport',
+    'WebSocketConnectionRegistry': '.transport',
+    'ConnectionHealthMonitor': '.transport',
+    'TransportFactory': '.transport',
+    
+    'MessageRouter': '.routing',
+    'BroadcastServiceImpl': '.routing',
+    'DeliveryResult': '.routing',
+    'DeliveryStatus': '.routing',
+    
+    'CommandHandler': '.commands',
+    'CommandRegistry': '.commands',
+    'CommandProcessor': '.commands',
+    'CommandContext': '.commands',
+    'CommandPriority': '.commands',
+    'create_default_processor': '.commands',
+    
+    'UnifiedWebSocketManager': '.websocket_manager',
+    'ConnectionContext': '.websocket_manager',
+    'MessageProcessingPipeline': '.websocket_manager',
+    'create_server': '.websocket_manager',
+    
+    'MessageBuilder': '.utils.helpers',
+    'create_server_message': '.utils.helpers',
+    'create_error_message': '.utils.helpers',
+    'create_join_message': '.utils.helpers',
+    'create_leave_message': '.utils.helpers',
+    'SafeSender': '.utils.helpers',
+}
 
 
 def _deprecated_warning(old_name, new_name):
@@ -155,9 +148,34 @@ def _deprecated_warning(old_name, new_name):
     )
 
 
-# WebSocketManager is now an alias to UnifiedWebSocketManager
-# The legacy WebSocketManager has been removed
-WebSocketManager = UnifiedWebSocketManager
+# Legacy name -> replacement; resolved on access with a warning and never
+# cached, so the legacy command module is only loaded when actually used.
+_DEPRECATED = {
+    'WebSocketManager': 'UnifiedWebSocketManager',
+    'COMMANDS': 'CommandProcessor',
+    'CommandSystem': 'CommandProcessor',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+    
+    if name not in _DEPRECATED:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    _deprecated_warning(name, _DEPRECATED[name])
+    if name == 'WebSocketManager':
+        # WebSocketManager is now an alias to UnifiedWebSocketManager
+        # The legacy WebSocketManager has been removed
+        return __getattr__('UnifiedWebSocketManager')
+    
+    from AloneChat.core.server import command
+    return getattr(command, name)
+
 
 __all__ = [
     'Authenticator',
@@ -212,8 +230,6 @@ __all__ = [
     'create_join_message',
     'create_leave_message',
     'SafeSender',
-    
-    'WebSocketManager',
-    'COMMANDS',
-    'CommandSystem',
 ]
+# The _DEPRECATED names stay importable by name but are left out of
+# __all__, so a star import neither warns nor loads the legacy module.
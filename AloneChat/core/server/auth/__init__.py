@@ -5,8 +5,12 @@ Provides JWT-based authentication with clear separation of concerns.
 Supports token extraction from query parameters and cookies.
 """
 
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import re
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from urllib.parse import parse_qs
 
 import jwt
@@ -16,6 +20,10 @@ from AloneChat.core.server.interfaces import Authenticator, AuthResult
 
 logger = logging.getLogger(__name__)
 
+# Value of the authToken cookie, without the optional DQUOTEs of RFC 6265;
+# anchored so e.g. xauthToken does not match
+_COOKIE_RE = re.compile(r'(?:^|;)\s*authToken="?([^;"]*)')
+
 
 class JWTAuthenticator:
     """
@@ -23,8 +31,14 @@ class JWTAuthenticator:
     
     Handles token validation using JWT and extracts tokens from
     various transport contexts (WebSocket connections).
+    
+    Successful validations are cached by token digest until the token's
+    ``exp`` claim, so a reconnecting client skips signature verification.
     """
     
+    # Upper bound on cached validations, evicted least recently used first
+    CACHED_TOKENS = 4096
+    
     def __init__(
         self,
         secret: str = None,
@@ -42,6 +56,18 @@ class JWTAuthenticator:
         self._secret = secret or config.JWT_SECRET
         self._algorithm = algorithm or config.JWT_ALGORITHM
         self._token_extractor = token_extractor or DefaultTokenExtractor()
+        # Token digest -> (result, exp timestamp); raw tokens are never kept
+        self._cache: "OrderedDict[bytes, Tuple[AuthResult, float]]" = OrderedDict()
+    
+    def rotate_secret(self, secret: str) -> None:
+        """
+        Replace the signing secret and drop every cached validation.
+        
+        Args:
+            secret: New JWT secret key
+        """
+        self._secret = secret
+        self._cache.clear()
     
     async def authenticate(self, token: str) -> AuthResult:
         """
@@ -53,6 +79,15 @@ class JWTAuthenticator:
         Returns:
             AuthResult with authentication status and username
         """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            result, expires_at = cached
+            if expires_at > time.time():
+                self._cache.move_to_end(key)
+                return result
+            del self._cache[key]
+        
         try:
             payload = jwt.decode(
                 token,
@@ -68,7 +103,12 @@ class JWTAuthenticator:
                     error_code="INVALID_PAYLOAD"
                 )
             
-            return AuthResult(success=True, username=username)
+            result = AuthResult(success=True, username=username)
+            exp = payload.get("exp")
+            self._cache[key] = (result, float(exp) if exp is not None else float("inf"))
+            if len(self._cache) > self.CACHED_TOKENS:
+                self._cache.popitem(last=False)
+            return result
             
         except jwt.ExpiredSignatureError:
             logger.warning("Authentication failed: Token expired")
@@ -154,11 +194,9 @@ class DefaultTokenExtractor:
         """Extract token from Cookie header."""
         try:
             headers = self._get_headers(websocket)
-            cookie_header = headers.get("Cookie", "")
-            
-            for cookie in cookie_header.split(";"):
-                if "authToken=" in cookie:
-                    return cookie.split("=", 1)[1].strip()
+            match = _COOKIE_RE.search(headers.get("Cookie", ""))
+            if match:
+                return match.group(1).strip()
         except Exception as e:
             logger.debug("Failed to extract token from cookie: %s", e)
         return None
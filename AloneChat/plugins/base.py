@@ -88,6 +88,10 @@ class PluginBase(ABC):
     The plugin system provides lifecycle management through these methods.
     """
     
+    # No per-instance state here, so subclasses that declare __slots__
+    # get instances without a __dict__
+    __slots__ = ()
+    
     _metadata: PluginMetadata = PluginMetadata(name="base")
 
     # noinspection PyPropertyDefinition
@@ -155,6 +159,8 @@ class CommandPluginBase(PluginBase):
     Command plugins can process user input and transform messages.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def can_handle(self, content: str) -> bool:
         """
@@ -191,6 +197,8 @@ class HandlerPluginBase(PluginBase):
     Handler plugins can intercept and process messages at various stages.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def handle(self, message: Any, context: "PluginContext") -> Optional[Any]:
         """
@@ -213,6 +221,8 @@ class MiddlewarePluginBase(PluginBase):
     Middleware plugins can intercept and modify the message pipeline.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def process(self, data: Any, next_handler: Callable) -> Any:
         """
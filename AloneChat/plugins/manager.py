@@ -7,7 +7,7 @@ including loading, initialization, activation, and shutdown.
 
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from AloneChat.plugins.base import (
     PluginBase,
@@ -71,6 +71,9 @@ class PluginManager:
         self._event_handlers: Dict[str, Dict[str, List[Callable]]] = {}
         self._plugin_paths: List[Path] = []
         self._initialized = False
+        # Active command plugins in priority order, rebuilt when the registry changes
+        self._command_plugins: Tuple[CommandPluginBase, ...] = ()
+        self._command_plugins_version: int = -1
     
     @property
     def registry(self) -> PluginRegistry:
@@ -396,14 +399,20 @@ class PluginManager:
         Returns:
             List of command plugin instances
         """
-        plugins = []
-        for info in self._registry.get_all().values():
-            if (info.state == PluginState.ACTIVE and 
-                isinstance(info.instance, CommandPluginBase)):
-                plugins.append(info.instance)
-        
-        plugins.sort(key=lambda p: p.metadata.priority.value)
-        return plugins
+        return list(self._active_command_plugins())
+    
+    def _active_command_plugins(self) -> Tuple[CommandPluginBase, ...]:
+        """Get the cached, priority-sorted active command plugins."""
+        if self._command_plugins_version != self._registry.version:
+            plugins = [
+                info.instance
+                for info in self._registry.get_by_state(PluginState.ACTIVE)
+                if isinstance(info.instance, CommandPluginBase)
+            ]
+            plugins.sort(key=lambda p: p.metadata.priority.value)
+            self._command_plugins = tuple(plugins)
+            self._command_plugins_version = self._registry.version
+        return self._command_plugins
     
     def process_command(
         self,
@@ -424,7 +433,7 @@ class PluginManager:
         """
         result = content
         
-        for plugin in self.get_command_plugins():
+        for plugin in self._active_command_plugins():
             try:
                 if plugin.can_handle(result):
                     result = plugin.execute(result, sender, target)
@@ -39,6 +39,13 @@ class PluginRegistry:
         self._plugins_by_tag: Dict[str, Set[str]] = {}
         self._plugins_by_provides: Dict[str, Set[str]] = {}
         self._dependency_graph: Dict[str, Set[str]] = {}
+        # Bumped whenever a plugin is added, removed or changes state
+        self._version: int = 0
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the set of plugins or their states change."""
+        return self._version
     
     def register(self, plugin: PluginBase, module_path: str = None) -> PluginInfo:
         """
@@ -71,6 +78,7 @@ class PluginRegistry:
         )
         
         self._plugins[name] = info
+        self._version += 1
         
         for tag in metadata.tags:
             if tag not in self._plugins_by_tag:
@@ -100,6 +108,7 @@ class PluginRegistry:
         info = self._plugins.pop(name, None)
         if not info:
             return None
+        self._version += 1
         
         metadata = info.metadata
         
@@ -223,6 +232,7 @@ class PluginRegistry:
         old_state = info.state
         info.state = state
         info.error_message = error_message
+        self._version += 1
         
         logger.debug(
             "Plugin '%s' state changed: %s -> %s",
@@ -319,6 +329,7 @@ class PluginRegistry:
         self._plugins_by_tag.clear()
         self._plugins_by_provides.clear()
         self._dependency_graph.clear()
+        self._version += 1
         logger.debug("Plugin registry cleared")
     
     def __contains__(self, name: str) -> bool:
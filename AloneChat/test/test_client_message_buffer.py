@@ -0,0 +1,155 @@
+"""
+Unit tests for the curses client message buffer.
+
+Tests cover:
+- Column-wise message storage and formatting
+- The version counter used to skip idle redraws
+- Scrolling, and keeping the scrolled view in place as old messages are evicted
+"""
+
+from AloneChat.core.client.ui.message_buffer import MessageBuffer, ScrollDirection
+
+
+class TestMessageStorage:
+    """Tests for adding and reading back messages."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.buffer = MessageBuffer(max_history=10)
+
+    def test_visible_rows_formatted_with_color(self):
+        """Test visible rows carry the formatted text and the sender's color pair."""
+        self.buffer.add_message("alice", "hi")
+        self.buffer.add_system_message("welcome")
+        self.buffer.add_error_message("oops")
+
+        assert self.buffer.get_visible_messages(5) == [
+            ("[alice] hi", 3),
+            ("[System] welcome", 1),
+            ("[! Error] oops", 2),
+        ]
+
+    def test_messages_property_matches_columns(self):
+        """Test the messages view rebuilds Message objects in order."""
+        self.buffer.add_message("alice", "one")
+        self.buffer.add_message("bob", "two")
+
+        messages = self.buffer.messages
+        assert [(m.sender, m.content, m.color_pair) for m in messages] == [
+            ("alice", "one", 3),
+            ("bob", "two", 3),
+        ]
+        assert messages[0].format() == "[alice] one"
+        assert messages[0].timestamp is not None
+
+    def test_history_bounded(self):
+        """Test the oldest messages are dropped beyond max_history."""
+        for i in range(15):
+            self.buffer.add_message("u", str(i))
+
+        assert len(self.buffer) == 10
+        assert self.buffer.messages[0].content == "5"
+
+    def test_clear(self):
+        """Test clear empties the buffer and resets scrolling."""
+        self.buffer.add_message("u", "x")
+        self.buffer.scroll(ScrollDirection.HOME, 5)
+        self.buffer.clear()
+
+        assert len(self.buffer) == 0
+        assert self.buffer.scroll_offset == 0
+        assert self.buffer.auto_scroll is True
+
+
+class TestVersion:
+    """Tests for the buffer version counter."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.buffer = MessageBuffer()
+
+    def test_changes_bump_version(self):
+        """Test every change that affects the view bumps the version."""
+        versions = [self.buffer.version]
+        self.buffer.add_message("u", "x")
+        versions.append(self.buffer.version)
+        self.buffer.scroll(ScrollDirection.UP, 5)
+        versions.append(self.buffer.version)
+        self.buffer.auto_scroll = True
+        versions.append(self.buffer.version)
+        self.buffer.clear()
+        versions.append(self.buffer.version)
+
+        assert len(set(versions)) == len(versions)
+
+    def test_reads_keep_version(self):
+        """Test reading the view leaves the version unchanged."""
+        self.buffer.add_message("u", "x")
+        version = self.buffer.version
+        self.buffer.get_visible_messages(5)
+        _ = self.buffer.messages, self.buffer.scroll_offset, len(self.buffer)
+
+        assert self.buffer.version == version
+
+
+class TestScrolling:
+    """Tests for scroll offset handling."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.buffer = MessageBuffer(max_history=10)
+        for i in range(10):
+            self.buffer.add_message("u", str(i))
+
+    def _visible(self, height: int = 5):
+        return [text for text, _ in self.buffer.get_visible_messages(height)]
+
+    def test_auto_scroll_follows_newest(self):
+        """Test the view shows the newest messages while auto-scrolling."""
+        assert self._visible() == ["[u] 5", "[u] 6", "[u] 7", "[u] 8", "[u] 9"]
+        assert self.buffer.scroll_offset == 5
+
+    def test_scroll_directions(self):
+        """Test each direction moves the offset and toggles auto-scroll."""
+        self._visible()
+        self.buffer.scroll(ScrollDirection.UP, 5)
+        assert (self.buffer.scroll_offset, self.buffer.auto_scroll) == (4, False)
+        self.buffer.scroll(ScrollDirection.PAGE_UP, 5)
+        assert self.buffer.scroll_offset == 0
+        self.buffer.scroll(ScrollDirection.PAGE_DOWN, 5)
+        assert (self.buffer.scroll_offset, self.buffer.auto_scroll) == (5, True)
+        self.buffer.scroll(ScrollDirection.HOME, 5)
+        assert (self.buffer.scroll_offset, self.buffer.auto_scroll) == (0, False)
+        self.buffer.scroll(ScrollDirection.END, 5)
+        assert self.buffer.auto_scroll is True
+
+    def test_scroll_down_to_bottom_resumes_auto_scroll(self):
+        """Test scrolling down onto the last page turns auto-scroll back on."""
+        self._visible()
+        self.buffer.scroll(ScrollDirection.UP, 5)
+        self.buffer.scroll(ScrollDirection.DOWN, 5)
+
+        assert self.buffer.auto_scroll is True
+
+    def test_eviction_keeps_scrolled_view(self):
+        """Test evicting old messages shifts the offset so the same messages stay in view."""
+        self.buffer.scroll(ScrollDirection.HOME, 5)
+        for _ in range(4):
+            self.buffer.scroll(ScrollDirection.DOWN, 5)
+        before = self._visible()
+
+        self.buffer.add_message("u", "10")
+        self.buffer.add_message("u", "11")
+
+        assert self.buffer.scroll_offset == 2
+        assert self._visible() == before
+
+    def test_eviction_past_view_clamps_offset(self):
+        """Test evicting more messages than the offset stops at the top."""
+        self.buffer.scroll(ScrollDirection.HOME, 5)
+        self.buffer.scroll(ScrollDirection.DOWN, 5)
+        for i in range(3):
+            self.buffer.add_message("u", "new %d" % i)
+
+        assert self.buffer.scroll_offset == 0
+        assert self._visible()[0] == "[u] 3"
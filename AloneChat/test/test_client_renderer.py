@@ -0,0 +1,173 @@
+"""
+Unit tests for the curses client renderer.
+
+Tests cover:
+- Row-by-row drawing of the message area
+- Multi-line messages not displacing neighbouring rows
+- Clipping rows to the display width of the terminal
+"""
+
+import curses
+import unicodedata
+
+import pytest
+
+from AloneChat.core.client.ui.message_buffer import MessageBuffer
+from AloneChat.core.client.ui.renderer import CursesRenderer
+
+
+class FakeScreen:
+    """
+    Character grid that follows curses' addstr semantics closely enough
+    to check what ends up on the terminal: a newline clears the rest of
+    the line and moves to the next one, wide characters take two cells,
+    long text wraps, and writing past the last cell raises curses.error.
+    """
+
+    def __init__(self, height: int = 6, width: int = 40):
+        self.height = height
+        self.width = width
+        self.cells = [[" "] * width for _ in range(height)]
+        self.y = 0
+        self.x = 0
+        self.writes = 0
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def move(self, y, x):
+        self.y, self.x = y, x
+
+    def clrtoeol(self):
+        for x in range(self.x, self.width):
+            self.cells[self.y][x] = " "
+
+    def addstr(self, y, x, text, attr=0):
+        self.writes += 1
+        self.move(y, x)
+        for ch in text:
+            if ch == "\n":
+                self.clrtoeol()
+                self.y, self.x = self.y + 1, 0
+            else:
+                cells = 2 if unicodedata.east_asian_width(ch) in "WF" else 1
+                if self.x + cells > self.width:
+                    self.y, self.x = self.y + 1, 0
+                    if self.y >= self.height:
+                        raise curses.error("addstr() returned ERR")
+                self.cells[self.y][self.x] = ch
+                if cells == 2:
+                    self.cells[self.y][self.x + 1] = ""
+                self.x += cells
+                if self.x == self.width:
+                    self.y, self.x = self.y + 1, 0
+            if self.y >= self.height:
+                raise curses.error("addstr() returned ERR")
+
+    def row(self, y: int) -> str:
+        return "".join(self.cells[y]).rstrip()
+
+    def __getattr__(self, name):
+        # keypad, nodelay, clear, noutrefresh, ...
+        return lambda *args: None
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    """A fake screen with the curses module calls the renderer makes stubbed out."""
+    monkeypatch.setattr(curses, "cbreak", lambda: None)
+    monkeypatch.setattr(curses, "noecho", lambda: None)
+    monkeypatch.setattr(curses, "has_colors", lambda: False)
+    monkeypatch.setattr(curses, "color_pair", lambda n: n << 8)
+    monkeypatch.setattr(curses, "doupdate", lambda: None)
+    return FakeScreen()
+
+
+class TestMessageArea:
+    """Tests for CursesRenderer.draw_message_area."""
+
+    def test_rows_drawn_at_their_own_line(self, screen):
+        """Test each visible message lands on its own row."""
+        renderer = CursesRenderer(screen)
+        buffer = MessageBuffer()
+        buffer.add_message("alice", "hi")
+        buffer.add_system_message("Connected to server")
+
+        renderer.update_display(buffer, "")
+
+        assert screen.row(0) == "[alice] hi"
+        assert screen.row(1) == "[System] Connected to server"
+        assert screen.row(screen.height - 1) == ">"
+
+    def test_multiline_message_keeps_following_rows(self, screen):
+        """Test a message containing newlines does not push later rows down."""
+        renderer = CursesRenderer(screen)
+        buffer = MessageBuffer()
+        buffer.add_system_message("Available commands:\n  /help - x")
+        buffer.add_system_message("Connected to server")
+        buffer.add_system_message("Type /help for commands")
+
+        renderer.update_display(buffer, "")
+
+        assert screen.row(1) == "[System] Connected to server"
+        assert screen.row(2) == "[System] Type /help for commands"
+
+    def test_shorter_row_clears_previous_text(self, screen):
+        """Test redrawing a row with shorter text leaves no trailing characters."""
+        renderer = CursesRenderer(screen)
+        buffer = MessageBuffer(max_history=5)
+        for i in range(5):
+            buffer.add_message("u", "a much longer message %d" % i)
+        renderer.update_display(buffer, "")
+
+        buffer.clear()
+        buffer.add_message("u", "short")
+        renderer.update_display(buffer, "")
+
+        assert screen.row(0) == "[u] short"
+        assert all(screen.row(y) == "" for y in range(1, screen.height - 1))
+
+
+class TestRowClipping:
+    """Tests for keeping every message on its own screen line."""
+
+    def test_control_characters_drawn_as_spaces(self, screen):
+        """Test newlines, tabs and carriage returns stay on the row."""
+        renderer = CursesRenderer(screen)
+        buffer = MessageBuffer()
+        buffer.add_system_message("a\tb\r\nc")
+        buffer.add_system_message("next")
+
+        renderer.update_display(buffer, "")
+
+        assert screen.row(0) == "[System] a b  c"
+        assert screen.row(1) == "[System] next"
+
+    def test_wide_characters_clipped_to_display_width(self, screen):
+        """Test a row of wide characters is cut at the screen width, not its length."""
+        renderer = CursesRenderer(screen)
+        buffer = MessageBuffer()
+        buffer.add_message("u", "\u4f60" * screen.width)
+        buffer.add_message("u", "second")
+
+        renderer.update_display(buffer, "")
+
+        assert screen.row(0).startswith("[u] \u4f60")
+        assert screen.row(1) == "[u] second"
+
+    def test_shadow_matches_screen_after_partial_redraw(self, screen):
+        """Test rows skipped as unchanged still show their own text."""
+        renderer = CursesRenderer(screen)
+        buffer = MessageBuffer()
+        buffer.add_message("u", "\u4f60" * screen.width)
+        buffer.add_message("u", "kept")
+        renderer.update_display(buffer, "")
+
+        buffer.add_message("u", "new")
+        writes = screen.writes
+        renderer.update_display(buffer, "x")
+
+        # Only the new message row and the input line were redrawn
+        assert screen.writes - writes == 2
+        for y, (text, _) in enumerate(renderer._shadow):
+            assert screen.row(y) == text.rstrip()
@@ -0,0 +1,53 @@
+"""
+Unit tests for the GUI search service.
+
+Tests cover:
+- Narrowing an incremental query to the previous hits
+- Resyncing hits after the chat view trims its oldest cards
+"""
+
+from AloneChat.core.client.gui.services.search_service import SearchService
+
+
+class FakeCard:
+    """Stand-in for a message card: searchable content plus highlight state."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.highlight = None
+
+    def set_highlight(self, on: bool, strong: bool = False) -> None:
+        self.highlight = ("strong" if strong else "weak") if on else None
+
+
+class TestSearchService:
+    """Tests for SearchService."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cards = [FakeCard(text) for text in ("apple", "banana", "apricot", "cherry")]
+        self.service = SearchService()
+        self.service.set_message_cards(self.cards)
+
+    def test_narrowing_keeps_matching_subset(self):
+        """Test a longer query only keeps hits that still match."""
+        assert self.service.search("ap") == 2
+        assert self.service.search("apr") == 1
+        assert self.service.get_current_hit_widget() is self.cards[2]
+        assert self.cards[0].highlight is None
+
+    def test_narrowing_after_trim(self):
+        """Test hit indices follow the cards after the oldest ones are trimmed."""
+        assert self.service.search("a") == 3
+
+        # The chat view trims in place, then the client resyncs
+        del self.cards[:2]
+        self.cards.append(FakeCard("papaya"))
+        self.service.set_message_cards(self.cards)
+
+        assert self.service.search("ap") == 2
+        hits = []
+        for _ in range(self.service.hit_count):
+            hits.append(self.service.get_current_hit_widget().content)
+            self.service.next_result()
+        assert hits == ["apricot", "papaya"]
@@ -0,0 +1,135 @@
+"""
+Unit tests for the logging system and its helpers.
+
+Tests cover:
+- Records passed through the logging queue to the handlers
+- JSON output of exception info after the queue
+- Records logged after the queue listener has stopped
+- Running timing statistics in MetricsCollector
+"""
+
+import io
+import json
+import logging
+import logging.handlers
+import queue
+
+import pytest
+
+from AloneChat.core.logging import (
+    JsonFormatter,
+    LogConfig,
+    LoggingManager,
+    _DeferredFormatQueueHandler,
+)
+from AloneChat.core.logging.utils import MetricsCollector
+
+
+@pytest.fixture
+def json_logger():
+    """A logger whose records reach a JSON handler through the logging queue."""
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, target)
+    listener.start()
+
+    logger = logging.getLogger("test_logging.queue")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    handler = _DeferredFormatQueueHandler(log_queue)
+    logger.addHandler(handler)
+
+    def records():
+        listener.stop()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield logger, records
+    logger.removeHandler(handler)
+
+
+class TestLoggingQueue:
+    """Tests for records sent through the queue to the handlers."""
+
+    def test_exception_kept_for_json(self, json_logger):
+        """Test exception info survives the queue as its own JSON field."""
+        logger, records = json_logger
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Failed %s", "op")
+
+        (entry,) = records()
+        assert entry["message"] == "Failed op"
+        assert "ValueError: boom" in entry["exception"]
+
+    def test_arguments_merged_at_call_time(self, json_logger):
+        """Test later changes to a mutable argument do not reach the record."""
+        logger, records = json_logger
+        items = ["a"]
+        logger.info("Items: %s", items)
+        items.append("b")
+
+        (entry,) = records()
+        assert entry["message"] == "Items: ['a']"
+
+
+class TestLoggingManager:
+    """Tests for LoggingManager's queue lifecycle."""
+
+    @pytest.fixture
+    def manager(self):
+        """The logging manager, with the root logger restored afterwards."""
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        manager = LoggingManager()
+        yield manager
+        manager._stop_queue_listener()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            if handler not in saved_handlers:
+                handler.close()
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+
+    def test_records_written_after_listener_stops(self, manager, tmp_path):
+        """Test records logged after the listener stops still reach the log file."""
+        manager.configure(LogConfig(
+            log_dir=str(tmp_path), console_output=False, file_output=True
+        ))
+        manager._stop_queue_listener()
+        logging.getLogger("test_logging.late").warning("after stop")
+
+        root = logging.getLogger()
+        assert not any(isinstance(h, _DeferredFormatQueueHandler) for h in root.handlers)
+        for handler in root.handlers:
+            handler.flush()
+        assert "after stop" in (tmp_path / "alonechat.log").read_text(encoding="utf-8")
+
+
+class TestMetricsCollector:
+    """Tests for MetricsCollector."""
+
+    def test_timing_stats(self):
+        """Test timings are summarized as count, total, min and max."""
+        metrics = MetricsCollector()
+        for duration in (0.2, 0.1, 0.3):
+            metrics.record_timing("query", duration)
+
+        count, total, min_val, max_val = metrics._timing_stats["query"]
+        assert count == 3
+        assert total == pytest.approx(0.6)
+        assert (min_val, max_val) == (0.1, 0.3)
+
+    def test_reset(self):
+        """Test reset drops counts and timings."""
+        metrics = MetricsCollector()
+        metrics.increment("messages")
+        metrics.record_timing("query", 0.1)
+        metrics.reset()
+
+        assert not metrics._counts
+        assert not metrics._timing_stats
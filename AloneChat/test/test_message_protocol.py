@@ -0,0 +1,73 @@
+"""
+Unit tests for the message protocol.
+
+Tests cover:
+- Template encoder output matching json.dumps byte for byte
+- orjson encoder output decoding to the same document as json.dumps
+- Serialize/deserialize round trips, including values orjson rejects
+"""
+
+import json
+
+import pytest
+
+from AloneChat.core.message import protocol
+from AloneChat.core.message.protocol import Message, MessageType
+
+# Strings that need escaping or are otherwise awkward for an encoder
+AWKWARD_STRINGS = [
+    "plain",
+    "",
+    'quote " and backslash \\',
+    "newline\n tab\t cr\r nul\x00 unit-sep\x1f del\x7f",
+    "héllo 你好 \U0001F600",
+    "line sep \u2028 para sep \u2029",
+    "</script>",
+    "lone surrogate \ud800",
+]
+
+
+def _expected(type_value, sender, content, target, command) -> str:
+    return json.dumps({
+        "type": type_value,
+        "sender": sender,
+        "content": content,
+        "target": target,
+        "command": command
+    })
+
+
+class TestEncoders:
+    """Tests for the module-level message encoders."""
+
+    @pytest.mark.parametrize("text", AWKWARD_STRINGS)
+    def test_template_matches_json_dumps(self, text):
+        """Test the template encoder produces exactly what json.dumps does."""
+        args = (1, text, text, None, text)
+        assert protocol._encode_template(*args) == _expected(*args)
+
+    @pytest.mark.parametrize("text", AWKWARD_STRINGS)
+    def test_encode_decodes_like_json_dumps(self, text):
+        """Test the active encoder (orjson when installed) yields the same document."""
+        args = (5, text, text, text, None)
+        assert json.loads(protocol._encode(*args)) == json.loads(_expected(*args))
+
+
+class TestMessageRoundTrip:
+    """Tests for Message.serialize and Message.deserialize."""
+
+    @pytest.mark.parametrize("text", AWKWARD_STRINGS)
+    def test_round_trip(self, text):
+        """Test a message survives serialize/deserialize unchanged."""
+        message = Message(MessageType.TEXT, "alice", text, target="bob", command=None)
+        assert Message.deserialize(message.serialize()) == message
+
+    def test_deserialize_bytes(self):
+        """Test deserialize accepts a bytes document."""
+        data = Message(MessageType.JOIN, "alice", "joined").serialize().encode()
+        assert Message.deserialize(data).type is MessageType.JOIN
+
+    def test_deserialize_malformed(self):
+        """Test malformed input raises json's decode error."""
+        with pytest.raises(json.JSONDecodeError):
+            Message.deserialize("{not json")
@@ -0,0 +1,181 @@
+"""
+Unit tests for server authentication.
+
+Tests cover:
+- JWT validation and the validation cache
+- Cache expiry by the token's exp claim and invalidation on secret rotation
+- Token extraction from query parameters and the Cookie header
+"""
+
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+
+from AloneChat.core.server import auth
+from AloneChat.core.server.auth import DefaultTokenExtractor, JWTAuthenticator
+
+SECRET = "test-secret-with-at-least-32-bytes!!"
+OTHER_SECRET = "another-secret-with-at-least-32-bytes"
+
+
+def make_token(sub="alice", ttl=3600, secret=SECRET) -> str:
+    """Create an HS256 token expiring ``ttl`` seconds from now."""
+    payload = {"exp": int(time.time()) + ttl}
+    if sub is not None:
+        payload["sub"] = sub
+    return jwt.encode(payload, secret, algorithm="HS256")
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """Count jwt.decode calls made by the authenticator."""
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    return calls
+
+
+class TestJWTAuthenticator:
+    """Tests for JWTAuthenticator.authenticate."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.authenticator = JWTAuthenticator(secret=SECRET, algorithm="HS256")
+
+    async def test_valid_token(self):
+        """Test a valid token authenticates its subject."""
+        result = await self.authenticator.authenticate(make_token())
+
+        assert result.success is True
+        assert result.username == "alice"
+
+    async def test_expired_token(self):
+        """Test an expired token is rejected."""
+        result = await self.authenticator.authenticate(make_token(ttl=-10))
+
+        assert result.success is False
+        assert result.error_code == "TOKEN_EXPIRED"
+
+    async def test_missing_subject(self):
+        """Test a token without a subject is rejected."""
+        result = await self.authenticator.authenticate(make_token(sub=None))
+
+        assert result.error_code == "INVALID_PAYLOAD"
+
+    async def test_cache_hit_skips_decode(self, decode_calls):
+        """Test a repeated token is served from the cache."""
+        token = make_token()
+        first = await self.authenticator.authenticate(token)
+        second = await self.authenticator.authenticate(token)
+
+        assert second is first
+        assert len(decode_calls) == 1
+
+    async def test_cache_keyed_by_digest(self):
+        """Test the cache holds token digests, not raw tokens."""
+        token = make_token()
+        await self.authenticator.authenticate(token)
+
+        (key,) = self.authenticator._cache
+        assert isinstance(key, bytes) and len(key) == 16
+        assert token.encode() != key
+
+    async def test_failures_not_cached(self, decode_calls):
+        """Test rejected tokens are decoded again on every attempt."""
+        token = make_token(secret=OTHER_SECRET)
+        for _ in range(2):
+            result = await self.authenticator.authenticate(token)
+            assert result.error_code == "INVALID_TOKEN"
+
+        assert len(decode_calls) == 2
+        assert not self.authenticator._cache
+
+    async def test_cache_entry_expires_with_token(self, monkeypatch, decode_calls):
+        """Test a cached result is dropped once the token's exp has passed."""
+        token = make_token(ttl=60)
+        await self.authenticator.authenticate(token)
+
+        # Move the cache's clock past exp; jwt.decode sees the same moment
+        later = time.time() + 120
+
+        def decode_later(*args, **kwargs):
+            raise jwt.ExpiredSignatureError("Signature has expired")
+
+        monkeypatch.setattr(auth, "time", SimpleNamespace(time=lambda: later))
+        monkeypatch.setattr(auth.jwt, "decode", decode_later)
+        result = await self.authenticator.authenticate(token)
+
+        assert result.error_code == "TOKEN_EXPIRED"
+        assert not self.authenticator._cache
+
+    async def test_rotate_secret_invalidates_cache(self, decode_calls):
+        """Test tokens signed with the old secret fail after rotation."""
+        token = make_token()
+        assert (await self.authenticator.authenticate(token)).success
+
+        self.authenticator.rotate_secret(OTHER_SECRET)
+        result = await self.authenticator.authenticate(token)
+
+        assert result.error_code == "INVALID_TOKEN"
+        assert len(decode_calls) == 2
+
+    async def test_cache_bounded(self, monkeypatch):
+        """Test the least recently used entry is evicted beyond CACHED_TOKENS."""
+        monkeypatch.setattr(JWTAuthenticator, "CACHED_TOKENS", 2)
+        tokens = [make_token(sub=name) for name in ("a", "b", "c")]
+        for token in tokens[:2]:
+            await self.authenticator.authenticate(token)
+        # Touch "a" so "b" becomes the least recently used
+        await self.authenticator.authenticate(tokens[0])
+        await self.authenticator.authenticate(tokens[2])
+
+        cached = {result.username for result, _ in self.authenticator._cache.values()}
+        assert cached == {"a", "c"}
+
+
+def make_websocket(path="/", cookie=None):
+    """Create a stand-in for a websockets connection with a request."""
+    headers = {"Cookie": cookie} if cookie is not None else {}
+    return SimpleNamespace(request=SimpleNamespace(path=path, headers=headers))
+
+
+class TestDefaultTokenExtractor:
+    """Tests for DefaultTokenExtractor."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.extractor = DefaultTokenExtractor()
+
+    @pytest.mark.parametrize("cookie, expected", [
+        ("authToken=abc", "abc"),
+        ('authToken="abc"', "abc"),
+        ("theme=dark; authToken=abc; lang=en", "abc"),
+        ("theme=dark;authToken=abc", "abc"),
+        ("theme=dark; authToken= abc ", "abc"),
+        ("xauthToken=bad; authToken=good", "good"),
+        ("xauthToken=bad", None),
+        ("theme=dark; lang=en", None),
+        ("", None),
+        ("authToken=", None),
+    ])
+    def test_cookie(self, cookie, expected):
+        """Test the authToken cookie is found among other cookies."""
+        websocket = make_websocket(cookie=cookie)
+        assert self.extractor.extract(websocket) == expected
+
+    def test_query_parameter_preferred(self):
+        """Test a token in the query string wins over the cookie."""
+        websocket = make_websocket(path="/ws?token=from-query", cookie="authToken=from-cookie")
+        assert self.extractor.extract(websocket) == "from-query"
+
+    def test_no_headers(self):
+        """Test a connection without headers yields no token."""
+        websocket = SimpleNamespace(request=None, path="/")
+        assert self.extractor.extract(websocket) is None
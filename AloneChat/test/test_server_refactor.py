@@ -361,6 +361,18 @@ class TestBackwardCompatibility:
         # WebSocketManager should now be an alias to UnifiedWebSocketManager
         assert WebSocketManager is UnifiedWebSocketManager
     
+    def test_star_import_skips_deprecated_names(self):
+        """Test that a star import neither warns nor exports legacy names."""
+        import warnings
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            namespace = {}
+            exec("from AloneChat.core.server import *", namespace)
+        
+        assert 'UnifiedWebSocketManager' in namespace
+        assert 'WebSocketManager' not in namespace
+    
     def test_import_legacy_command_system(self):
         """Test that legacy command system can be imported."""
         from AloneChat.core.server.command import CommandSystem